@@ -5,10 +5,13 @@ Real-time memory monitoring, large-scale data generation, and efficient search.
 """
 
 import streamlit as st
+import functools
 import gc
+import random
 import sys
-import plotly.graph_objects as go
-from collections import Counter
+import numpy as np
+import psutil
+from collections import deque
 from models import Elephant
 from memory import MemoryMonitor
 from memory.store import get_store
@@ -18,6 +21,20 @@ from search.engine import ElephantSearchEngine
 # Color palette for charts
 CHART_COLORS = ['#3498db', '#2ecc71', '#f39c12', '#e74c3c', '#9b59b6', '#1abc9c', '#e67e22', '#34495e']
 
+
+@functools.lru_cache(maxsize=None)
+def _go():
+    """
+    Deferred plotly import.
+
+    plotly costs hundreds of ms and several MB of RSS at import time;
+    loading it on first chart build keeps cold start lean and the
+    framework-baseline memory figure honest. The module cache makes
+    every later call free.
+    """
+    import plotly.graph_objects as go
+    return go
+
 # Page config
 st.set_page_config(
     page_title="🐘 Elephant Memory Cloud",
@@ -32,6 +49,484 @@ if 'monitor' not in st.session_state:
     st.session_state.search_engine = ElephantSearchEngine()
     st.session_state.large_dataset_generated = False
     st.session_state.references_broken = False  # Track if we've broken references
+    st.session_state.dataset_version = 0  # Bumped on every regenerate/clear
+    st.session_state.elephant_name_sample = []  # First 100 names, cached per dataset
+
+    # Freeze the startup heap (Streamlit + imports, ~150k objects) so
+    # every later collection walks only objects allocated afterwards,
+    # and raise the gen1/gen2 thresholds to cut full-heap passes
+    gc.freeze()
+    gc.set_threshold(700, 50, 50)
+
+# Store statistics, fetched once per rerun and shared across tabs.
+# get_stats() itself is memoized against the store version, so repeat
+# calls are O(1), but reusing one local keeps the intent obvious.
+store_stats = st.session_state.store.get_stats()
+
+# Cached search queries. These are pure functions of (store contents,
+# query args); keying on the dataset version makes repeat queries O(1)
+# across reruns. Only plain-data results are cached — queries returning
+# Event/Elephant objects would make st.cache_data deep-copy the circular
+# object graph on every hit.
+@st.cache_data(show_spinner=False)
+def _cached_search_droughts(dataset_version: int, start_year: int, end_year: int):
+    return st.session_state.search_engine.search_droughts(start_year, end_year)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_migration_alerts(dataset_version: int):
+    return st.session_state.search_engine.get_migration_alerts()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_year_type_counts(dataset_version: int, year: int):
+    return st.session_state.search_engine.get_year_type_counts(year)
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _generate_dataset(
+    num_families: int,
+    generations: int,
+    children_per_elephant: int,
+    num_herds: int,
+    num_events: int,
+    seed: int
+):
+    """
+    Build the full object graph for one parameter set.
+
+    cache_resource rather than cache_data: the graph is riddled with
+    circular references and events/herds point back into the elephant
+    list, so it must be returned by reference, never serialized. With
+    an explicit seed in the key, regenerating at identical parameters
+    is an O(1) cache hit instead of a multi-second rebuild.
+    """
+    random.seed(seed)
+    # One seeded generator for every batched numpy draw: the widget's
+    # seed must reproduce the full dataset, not just the stdlib-random
+    # parts (family topology and names)
+    rng = np.random.default_rng(seed)
+    # Pause the cyclic GC while tens of thousands of cyclic objects are
+    # constructed: every automatic generational scan during this block
+    # would touch the whole live graph and collect nothing
+    gc.disable()
+    try:
+        elephants = DataGenerator.generate_multiple_families(
+            num_families=num_families,
+            generations=generations,
+            children_per_elephant=children_per_elephant
+        )
+        herds = DataGenerator.generate_herds(num_herds, rng=rng)
+        DataGenerator.assign_elephants_to_herds(elephants, herds, rng=rng)
+        water_sources = DataGenerator.generate_water_sources()
+        events = DataGenerator.generate_events(elephants, herds, num_events, rng=rng)
+    finally:
+        gc.enable()
+    return elephants, herds, events, water_sources
+
+
+@st.cache_resource(show_spinner=False)
+def _build_family_index(dataset_version: int):
+    """
+    Walk the archive once and derive the genealogy aggregates.
+
+    Keyed on the dataset version so the O(N · depth) walk runs once per
+    generated dataset instead of on every tab4 rerun. cache_resource:
+    the result holds live Elephant objects with circular references.
+    """
+    elephants = st.session_state.store.elephants
+
+    families = {}
+    root_by_name = {}
+    generations = {}
+    orphans = []
+    max_depth = 0
+    depth_warnings = []
+
+    # Memoized root lookup with path compression (union-find style):
+    # each elephant's (root, depth) is cached the first time its chain
+    # is walked, so shared ancestry is chased once instead of once per
+    # descendant — amortized O(N) instead of O(N · depth)
+    root_of = {}
+    depths = []
+
+    for elephant in elephants:
+        path = []
+        node = elephant
+        while node not in root_of and node.parent and len(path) < 100:
+            path.append(node)
+            node = node.parent
+
+        # Flag if we hit the depth limit (possible data corruption)
+        if len(path) >= 100:
+            depth_warnings.append(elephant.name)
+
+        if node in root_of:
+            root, base_depth = root_of[node]
+        else:
+            root, base_depth = node, 0
+            root_of[node] = (root, 0)
+
+        # Compress: everything on the walked chain now maps to the root
+        for offset, ancestor in enumerate(reversed(path), start=1):
+            root_of[ancestor] = (root, base_depth + offset)
+
+        depth = root_of[elephant][1]
+        max_depth = max(max_depth, depth)
+        # Names are interned at construction, so the shared str object
+        # carries a cached hash — both lookups below are effectively
+        # identity probes on repeat visits
+        root_name = root.name
+        families.setdefault(root_name, []).append(elephant)
+        root_by_name.setdefault(root_name, root)
+
+        # Track generation depth
+        generations[elephant.name] = depth
+        depths.append(depth)
+
+        # Find orphans (no parent, but not a root with children)
+        if not elephant.parent and len(elephant.children) == 0:
+            orphans.append(elephant)
+
+    # Columnar views over the objects, maintained by the store (rebuilt
+    # once per store version); one array pass replaces the half-dozen
+    # per-rerun Python loops the aggregate metrics used to run
+    births = st.session_state.store.birth_years_np
+    kids = st.session_state.store.child_counts_np
+
+    # Generation depths as a tight column (walk is capped at depth 100,
+    # so int8 is plenty); histogram consumers bincount this directly
+    gens_np = np.fromiter(depths, dtype=np.int8, count=len(depths))
+
+    # Family browser data, presorted once so selection is O(1) at
+    # interaction time instead of a sort + scan per rerun
+    sorted_families = sorted(families.items(), key=lambda x: len(x[1]), reverse=True)
+    family_options = [
+        f"{root} ({len(members)} elephants)" for root, members in sorted_families
+    ]
+
+    return {
+        'families': families,
+        'root_by_name': root_by_name,
+        'sorted_families': sorted_families,
+        'family_options': family_options,
+        'generations': generations,
+        'orphans': orphans,
+        'max_depth': max_depth,
+        'depth_warnings': depth_warnings,
+        'births': births,
+        'kids': kids,
+        'gens_np': gens_np,
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def _family_csr(dataset_version: int, root_name: str):
+    """
+    CSR-style layout of one family tree.
+
+    Children of node i sit in children_flat[offsets[i]:offsets[i+1]],
+    so tree walks become sequential array reads instead of pointer
+    chases through per-elephant child lists. Built once per family per
+    dataset.
+    """
+    root = _build_family_index(dataset_version)['root_by_name'][root_name]
+
+    # BFS assigns ids in discovery order
+    nodes = [root]
+    index_of = {id(root): 0}
+    cursor = 0
+    while cursor < len(nodes):
+        for child in nodes[cursor].children:
+            if id(child) not in index_of:
+                index_of[id(child)] = len(nodes)
+                nodes.append(child)
+        cursor += 1
+
+    counts = np.fromiter(
+        (len(n.children) for n in nodes), dtype=np.int64, count=len(nodes)
+    )
+    offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    children_flat = np.fromiter(
+        (index_of[id(c)] for n in nodes for c in n.children),
+        dtype=np.int64,
+        count=int(offsets[-1])
+    )
+    return nodes, offsets, children_flat
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_memory_pie(
+    elephants_mb: float,
+    events_mb: float,
+    herds_mb: float,
+    water_mb: float,
+    total_mb: float,
+    orphaned: bool
+):
+    """
+    Build the memory-distribution pie for one rounded measurement.
+
+    Inputs are pre-rounded by the caller so tiny fluctuations between
+    reruns don't bust the cache; identical states skip both figure
+    construction and plotly JSON serialization.
+    """
+    labels = []
+    values = []
+    colors = []
+
+    if elephants_mb > 0.01:
+        # Show if elephants are orphaned or active
+        if orphaned:
+            labels.append('👻 Orphaned Elephants')
+            colors.append('#e74c3c')  # Red for orphaned
+        else:
+            labels.append('🐘 Elephants')
+            colors.append('#3498db')  # Blue for active
+        values.append(elephants_mb)
+
+    if events_mb > 0.01:
+        labels.append('📅 Events')
+        values.append(events_mb)
+        colors.append('#2ecc71')
+
+    if herds_mb > 0.01:
+        labels.append('👥 Herds')
+        values.append(herds_mb)
+        colors.append('#f39c12')
+
+    if water_mb > 0.01:
+        labels.append('💧 Water Sources')
+        values.append(water_mb)
+        colors.append('#9b59b6')
+
+    data_mb = elephants_mb + events_mb + herds_mb + water_mb
+
+    go = _go()
+    fig = go.Figure(data=[go.Pie(
+        labels=labels,
+        values=values,
+        hole=0.4,
+        marker=dict(colors=colors),
+        textinfo='label+percent',
+        textfont=dict(size=12),
+        hovertemplate='<b>%{label}</b><br>%{value:.2f} MB<br>%{percent}<extra></extra>'
+    )])
+
+    fig.update_layout(
+        title={
+            'text': f"Data Memory: {data_mb:.2f} MB (Total: {total_mb:.2f} MB)",
+            'x': 0.5,
+            'xanchor': 'center'
+        },
+        height=400,
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="left",
+            x=1.05
+        )
+    )
+    return fig
+
+
+@functools.lru_cache(maxsize=None)
+def _estimate_dataset_size(num_families: int, generations: int, children_per_elephant: int):
+    """
+    Estimated elephant count (and realistic range) for the tab2 info line.
+
+    Memoized: the parameter space is tiny, so each combination is
+    computed once per process instead of on every slider rerun.
+    """
+    # random.randint(1, children_per_elephant + 1) gives 1, 2, ..., children_per_elephant+1
+    # Average = (1 + children_per_elephant + 1) / 2
+    avg_children = (children_per_elephant + 2) / 2
+
+    # Geometric series: sum of avg_children^i for i from 0 to generations-1
+    if avg_children == 1:
+        elephants_per_family = generations  # Special case: 1+1+1+...
+    else:
+        elephants_per_family = (avg_children ** generations - 1) / (avg_children - 1)
+
+    estimated = int(num_families * elephants_per_family)
+
+    # Realistic range: 70% to 140% due to random variation
+    return estimated, int(estimated * 0.7), int(estimated * 1.4)
+
+
+@st.cache_resource(show_spinner=False)
+def _family_tree_figure(dataset_version: int, root_name: str, max_nodes=1500):
+    """
+    Plotly figure for one family tree, cached per dataset and family.
+
+    Walks the CSR layout with an explicit-stack DFS, lays nodes out by
+    generation, and builds the two scatter traces. Once max_nodes is
+    reached, whole subtrees are collapsed into one summary node each so
+    huge families stay renderable; pass max_nodes=None to plot all.
+    Cached so reruns with an unchanged selection skip both the walk and
+    the plotly serialization.
+    """
+    go = _go()
+    tree_nodes, offsets, children_flat = _family_csr(dataset_version, root_name)
+
+    # Subtree sizes, children before parents (reverse BFS order)
+    subtree = [1] * len(tree_nodes)
+    for i in range(len(tree_nodes) - 1, -1, -1):
+        for j in children_flat[offsets[i]:offsets[i + 1]]:
+            subtree[i] += subtree[int(j)]
+
+    nodes = {}  # {name: {generation, birth_year, num_children, collapsed}}
+    edges = []  # [(parent_name, child_name), ...]
+
+    # BFS so each generation is visited (mostly) contiguously
+    q = deque([(0, 0)])  # (node index, generation)
+    while q:
+        i, generation = q.popleft()
+        elephant = tree_nodes[i]
+        nodes[elephant.name] = {
+            'generation': generation,
+            'birth_year': elephant.birth_year,
+            'num_children': len(elephant.children),
+            'collapsed': False
+        }
+        for j in children_flat[offsets[i]:offsets[i + 1]]:
+            j = int(j)
+            over_budget = (
+                max_nodes is not None
+                and len(nodes) + len(q) >= max_nodes
+            )
+            if over_budget and subtree[j] > 1:
+                # Collapse the whole subtree into one summary node
+                label = f"{tree_nodes[j].name} (+{subtree[j] - 1})"
+                nodes[label] = {
+                    'generation': generation + 1,
+                    'birth_year': tree_nodes[j].birth_year,
+                    'num_children': subtree[j] - 1,
+                    'collapsed': True
+                }
+                edges.append((elephant.name, label))
+            else:
+                edges.append((elephant.name, tree_nodes[j].name))
+                q.append((j, generation + 1))
+
+    # Hierarchical layout, flat-array style: one generation column plus
+    # a stable argsort gives each node its within-generation rank, and
+    # every position comes out of a handful of broadcasts — no grouping
+    # dict, no per-node (x, y) tuples
+    node_names = list(nodes)
+    n = len(node_names)
+    gens_arr = np.fromiter(
+        (nodes[name]['generation'] for name in node_names), np.int32, count=n
+    )
+    order = np.argsort(gens_arr, kind='stable')
+    counts = np.bincount(gens_arr)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rank = np.empty(n, np.int64)
+    rank[order] = np.arange(n) - starts[gens_arr[order]]
+    node_x = ((rank - counts[gens_arr] / 2) * 150).astype(np.float32)  # Horizontal spacing
+    node_y = (gens_arr * -100).astype(np.float32)  # Vertical spacing
+
+    # Create edges: strided numpy fills instead of a Python loop with
+    # three appends per edge; NaN breaks the line between segments and
+    # plotly serializes the arrays without touching each element
+    name_to_idx = {name: i for i, name in enumerate(node_names)}
+    ei = np.fromiter((name_to_idx[p] for p, _ in edges), np.int32, count=len(edges))
+    ej = np.fromiter((name_to_idx[c] for _, c in edges), np.int32, count=len(edges))
+    edge_x = np.empty(3 * len(edges), np.float32)
+    edge_y = np.empty(3 * len(edges), np.float32)
+    edge_x[0::3] = node_x[ei]
+    edge_x[1::3] = node_x[ej]
+    edge_x[2::3] = np.nan
+    edge_y[0::3] = node_y[ei]
+    edge_y[1::3] = node_y[ej]
+    edge_y[2::3] = np.nan
+
+    # Scattergl: WebGL renders each trace in one GL draw call instead
+    # of thousands of SVG DOM nodes for large families
+    edge_trace = go.Scattergl(
+        x=edge_x, y=edge_y,
+        line=dict(width=2, color='#95a5a6'),
+        hoverinfo='none',
+        mode='lines'
+    )
+
+    # Generation-based colors in one vectorized gather (positions are
+    # already in node_x / node_y, aligned with nodes order); collapsed
+    # summary nodes get overridden to grey below
+    colors_arr = np.array(CHART_COLORS)
+    node_color = colors_arr[gens_arr % len(colors_arr)].tolist()
+    node_text = []
+    node_size = []
+    node_hover = []
+
+    for idx, (node_name, node_data) in enumerate(nodes.items()):
+        generation = node_data['generation']
+        birth_year = node_data['birth_year']
+        num_children = node_data['num_children']
+
+        if node_data['collapsed']:
+            # Summary node: label with the hidden count, scale the
+            # marker with how much it stands in for
+            node_text.append(f"+{num_children}")
+            node_color[idx] = '#7f8c8d'
+            node_size.append(min(20 + num_children // 10, 50))
+            node_hover.append(f"<b>{node_name}</b><br>Collapsed subtree: {num_children} hidden descendants<br>Generation: {generation}")
+            continue
+
+        # Short name for display
+        short_name = node_name.split('_')[0] if '_' in node_name else node_name[:8]
+        node_text.append(short_name)
+        node_size.append(20)
+
+        # Hover info
+        node_hover.append(f"<b>{node_name}</b><br>Born: {birth_year}<br>Children: {num_children}<br>Generation: {generation}")
+
+    node_trace = go.Scattergl(
+        x=node_x, y=node_y,
+        mode='markers+text',
+        hoverinfo='text',
+        text=node_text,
+        hovertext=node_hover,
+        textposition="bottom center",
+        textfont=dict(size=10),
+        marker=dict(
+            color=node_color,
+            size=node_size,
+            line=dict(width=2, color='white')
+        )
+    )
+
+    return go.Figure(
+        data=[edge_trace, node_trace],
+        layout=go.Layout(
+            title=f"Family Tree: {root_name} ({len(tree_nodes)} elephants)",
+            showlegend=False,
+            hovermode='closest',
+            uirevision=root_name,  # Preserve zoom/pan across reruns
+            margin=dict(b=20, l=20, r=20, t=60),
+            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+            height=600
+        )
+    )
+
+
+def _heap_object_count() -> int:
+    """
+    Approximate count of GC-tracked objects.
+
+    len(gc.get_objects()) materializes the entire tracked heap as one
+    Python list (hundreds of thousands of entries with a full archive),
+    so the value is captured once per dataset and reused across reruns.
+    Generation, "Run GC", and "Refresh Statistics" drop the cached value.
+    """
+    if 'heap_object_count' not in st.session_state:
+        st.session_state.heap_object_count = len(gc.get_objects())
+    return st.session_state.heap_object_count
+
 
 # Header
 st.title("🐘 Elephant Memory Cloud")
@@ -47,28 +542,33 @@ tab1, tab2, tab3, tab4 = st.tabs([
 ])
 
 # ============================================================================
-# TAB 1: Dashboard Overview
+# TAB 1: Dashboard Overview. The body is a fragment: GC-demo button
+# clicks that only change dashboard state rerun just this tab instead
+# of re-executing the whole script. Break References stays an app-wide
+# rerun because it flips flags that gate tabs 2-4.
 # ============================================================================
-with tab1:
+@st.fragment
+def _dashboard_fragment():
     st.header("🏠 Archive Overview")
     st.markdown("Real-time statistics of the Elephant Memory Cloud archive")
     
     # Main dashboard metrics
     col1, col2, col3, col4 = st.columns(4)
 
-    # Get current stats
-    gc.collect()
+    # Get current stats (computed once per rerun and reused below).
+    # gc.collect() is deliberately NOT called here: a full collection on a
+    # heap with thousands of circular refs would run on every widget
+    # interaction. Use the "Refresh Statistics" button for a deep refresh.
     gc_count = gc.get_count()
-    gc_objects = len(gc.get_objects())  # Capture once for consistent reporting
+    gc_objects = _heap_object_count()  # Approximate; see helper above
     memory_mb = st.session_state.monitor.get_process_memory_mb()
-    store_stats = st.session_state.store.get_stats()
-    
+
     with col1:
         st.metric("💾 Process Memory", f"{memory_mb:.2f} MB")
         st.metric("🐘 Total Elephants", f"{store_stats['total_elephants']:,}")
 
     with col2:
-        st.metric("🔗 Python Objects", f"{gc_objects:,}")
+        st.metric("🔗 Python Objects (approx)", f"{gc_objects:,}")
         st.metric("👥 Herds", store_stats['total_herds'])
 
     with col3:
@@ -126,8 +626,17 @@ with tab1:
                      type="secondary"):
             # Clear store - makes elephants unreachable but doesn't collect them yet
             st.session_state.store.clear()
+            # The generation and genealogy caches also hold strong refs
+            # to the graph; drop them so only the circular refs keep
+            # the elephants alive
+            _generate_dataset.clear()
+            _build_family_index.clear()
+            _family_csr.clear()
+            _family_tree_figure.clear()
             st.session_state.large_dataset_generated = False
             st.session_state.references_broken = True
+            st.session_state.dataset_version += 1
+            st.session_state.elephant_name_sample = []
             st.rerun()
     
     with col_btn2:
@@ -137,28 +646,41 @@ with tab1:
                      type="primary"):
             # Take snapshot before GC
             count_before = Elephant.get_instance_count()
-            memory_before = st.session_state.monitor.get_process_memory_mb()
-            
-            # Force GC - now it can collect the orphaned cycles
-            collected = gc.collect()
+            memory_before = st.session_state.monitor.get_process_memory_mb(max_age_s=0.0)
             
+            # Force a gen-2 collection - now it can collect the orphaned
+            # cycles. store.clear() thawed the permanent generation, so
+            # this one pass walks the startup baseline too.
+            collected = gc.collect(2)
+
+            # Re-pin the survivors (the startup baseline — the orphans
+            # are gone now). Without this, every later gen-2 pass would
+            # keep rescanning the full Streamlit heap.
+            gc.freeze()
+
             # Take snapshot after GC
             count_after = Elephant.get_instance_count()
-            memory_after = st.session_state.monitor.get_process_memory_mb()
+            memory_after = st.session_state.monitor.get_process_memory_mb(max_age_s=0.0)
             
             st.session_state.references_broken = False
-            
+            # The cached heap count predates the collection; drop it so
+            # the metric reflects the freed objects on this rerun
+            st.session_state.pop('heap_object_count', None)
+
             st.success("✅ **Garbage Collection Complete!**")
             st.metric("🐘 Elephants Freed", f"{count_before - count_after:,}")
             st.metric("🗑️ Total Objects Collected", f"{collected:,}")
             st.metric("💾 Memory Freed", f"{memory_before - memory_after:.2f} MB")
+            st.caption("One full gen-2 pass; the startup baseline is re-frozen afterwards")
             st.balloons()
             st.success("🎯 **Cyclic GC successfully cleaned up circular references that reference counting couldn't handle!**")
-            st.rerun()
+            st.rerun(scope="fragment")  # Only dashboard state changed
     
     with col_btn3:
         if st.button("🔄 Refresh Statistics", use_container_width=True):
-            st.rerun()
+            gc.collect()  # Deep refresh: collect once, on demand only
+            st.session_state.pop('heap_object_count', None)
+            st.rerun(scope="fragment")  # Only dashboard state changed
     
     st.divider()
     
@@ -173,21 +695,35 @@ with tab1:
             """Recursively calculate memory size of objects"""
             if seen is None:
                 seen = set()
-            
+
             obj_id = id(obj)
             if obj_id in seen:
                 return 0
-            
+
+            # Modules drag in the whole interpreter's globals — not
+            # data memory, and sizing them once per walk is misleading
+            if isinstance(obj, type(sys)):
+                return 0
+
             seen.add(obj_id)
             size = sys.getsizeof(obj)
-            
+
             if isinstance(obj, dict):
                 size += sum(get_deep_size(k, seen) + get_deep_size(v, seen) for k, v in obj.items())
             elif isinstance(obj, (list, tuple, set)):
                 size += sum(get_deep_size(item, seen) for item in obj)
             elif hasattr(obj, '__dict__'):
                 size += get_deep_size(obj.__dict__, seen)
-            
+            elif hasattr(obj, '__slots__'):
+                # Slotted instances (all the model classes) have no
+                # __dict__; walk the slot attributes explicitly so
+                # their contents still count
+                size += sum(
+                    get_deep_size(getattr(obj, slot), seen)
+                    for slot in obj.__slots__
+                    if slot != '__weakref__' and hasattr(obj, slot)
+                )
+
             return size
         
         # Calculate memory breakdown using actual measurements
@@ -201,97 +737,40 @@ with tab1:
         else:
             elephant_count = 0
         
-        # Calculate actual memory for each category (in bytes, then convert to MB)
-        elephants_memory = get_deep_size(st.session_state.store.elephants) / (1024 * 1024) if st.session_state.store.elephants else 0
-        events_memory = get_deep_size(st.session_state.store.events) / (1024 * 1024) if st.session_state.store.events else 0
-        herds_memory = get_deep_size(st.session_state.store.herds) / (1024 * 1024) if st.session_state.store.herds else 0
-        water_memory = get_deep_size(st.session_state.store.water_sources) / (1024 * 1024) if st.session_state.store.water_sources else 0
-        
+        # Deep-sizing the store is an O(dataset) recursive walk; it only
+        # depends on store contents, so reuse the last measurement until
+        # the store version moves on (sentinel in session_state)
+        store = st.session_state.store
+        if st.session_state.get('deep_size_version') != store.version:
+            mb = 1024 * 1024
+            st.session_state.deep_sizes = (
+                get_deep_size(store.elephants) / mb if store.elephants else 0,
+                get_deep_size(store.events) / mb if store.events else 0,
+                get_deep_size(store.herds) / mb if store.herds else 0,
+                get_deep_size(store.water_sources) / mb if store.water_sources else 0,
+            )
+            st.session_state.deep_size_version = store.version
+
+        elephants_memory, events_memory, herds_memory, water_memory = st.session_state.deep_sizes
+
         # Calculate data memory
         data_memory = elephants_memory + events_memory + herds_memory + water_memory
         
         # Framework memory is the rest
         framework_memory = max(0, total_memory - data_memory)
         
-        # Create labels and values
-        labels = []
-        values = []
-        colors = []
-        
-        # Always include Python Runtime but hide it by default
-        labels.append('🐍 Python Runtime')
-        values.append(framework_memory)
-        colors.append('#95a5a6')
-        
-        if elephants_memory > 0.01:
-            # Show if elephants are orphaned or active
-            if st.session_state.references_broken:
-                labels.append('👻 Orphaned Elephants')
-                colors.append('#e74c3c')  # Red for orphaned
-            else:
-                labels.append('🐘 Elephants')
-                colors.append('#3498db')  # Blue for active
-            values.append(elephants_memory)
-        
-        if events_memory > 0.01:
-            labels.append('📅 Events')
-            values.append(events_memory)
-            colors.append('#2ecc71')
-        
-        if herds_memory > 0.01:
-            labels.append('👥 Herds')
-            values.append(herds_memory)
-            colors.append('#f39c12')
-        
-        if water_memory > 0.01:
-            labels.append('💧 Water Sources')
-            values.append(water_memory)
-            colors.append('#9b59b6')
-        
-        # Create pie chart - filter out Python Runtime for display, but keep in legend
-        display_labels = []
-        display_values = []
-        display_colors = []
-        
-        # Separate Python Runtime from data
-        python_runtime_value = 0
-        for i, label in enumerate(labels):
-            if label == '🐍 Python Runtime':
-                python_runtime_value = values[i]
-            else:
-                display_labels.append(label)
-                display_values.append(values[i])
-                display_colors.append(colors[i])
-        
-        fig = go.Figure(data=[go.Pie(
-            labels=display_labels,
-            values=display_values,
-            hole=0.4,
-            marker=dict(colors=display_colors),
-            textinfo='label+percent',
-            textfont=dict(size=12),
-            hovertemplate='<b>%{label}</b><br>%{value:.2f} MB<br>%{percent}<extra></extra>'
-        )])
-        
-        fig.update_layout(
-            title={
-                'text': f"Data Memory: {data_memory:.2f} MB (Total: {total_memory:.2f} MB)",
-                'x': 0.5,
-                'xanchor': 'center'
-            },
-            height=400,
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="middle",
-                y=0.5,
-                xanchor="left",
-                x=1.05
-            )
+        # Figure construction + plotly serialization are cached on the
+        # rounded inputs, so reruns with unchanged memory skip both
+        fig = _build_memory_pie(
+            round(elephants_memory, 2),
+            round(events_memory, 2),
+            round(herds_memory, 2),
+            round(water_memory, 2),
+            round(total_memory, 1),
+            st.session_state.references_broken
         )
-        
         st.plotly_chart(fig, use_container_width=True)
-        st.caption(f"💡 Python Runtime ({python_runtime_value:.2f} MB) excluded from chart for clarity")
+        st.caption(f"💡 Python Runtime ({framework_memory:.2f} MB) excluded from chart for clarity")
     
     with col_metrics:
         st.markdown("### 📈 Detailed Memory Breakdown")
@@ -337,6 +816,10 @@ with tab1:
     else:
         st.success(f"✅ **Archive Active:** {store_stats['total_elephants']:,} elephants, {store_stats['circular_references']:,} circular references")
 
+
+with tab1:
+    _dashboard_fragment()
+
 # ============================================================================
 # TAB 2: Data Generation
 # ============================================================================
@@ -366,79 +849,86 @@ with tab2:
         
         with col_c:
             num_events = st.number_input("Number of Events", min_value=100, max_value=10000, value=1000, step=100)
+            seed = st.number_input("Random Seed", min_value=0, max_value=99999, value=42)
         
-        # Calculate accurate estimate based on actual generation logic
-        # random.randint(1, children_per_elephant + 1) gives 1, 2, ..., children_per_elephant+1
-        # Average = (1 + children_per_elephant + 1) / 2
-        avg_children = (children_per_elephant + 2) / 2
-        
-        # Geometric series: sum of avg_children^i for i from 0 to generations-1
-        if avg_children == 1:
-            elephants_per_family = generations  # Special case: 1+1+1+...
-        else:
-            elephants_per_family = (avg_children ** generations - 1) / (avg_children - 1)
-        
-        estimated_elephants = int(num_families * elephants_per_family)
-        
-        # Realistic range: 70% to 140% due to random variation
-        range_low = int(estimated_elephants * 0.7)
-        range_high = int(estimated_elephants * 1.4)
-        
+        # Accurate estimate based on actual generation logic (memoized)
+        estimated_elephants, range_low, range_high = _estimate_dataset_size(
+            num_families, generations, children_per_elephant
+        )
+
         st.info(f"📊 **Estimated Dataset**: ~{estimated_elephants:,} elephants (range: {range_low:,}-{range_high:,}), {num_events:,} events, {num_herds} herds")
-        
-        if st.button("🚀 Generate Large Dataset", type="primary", use_container_width=True):
-            # Clear existing data and run GC to free old elephants
-            st.session_state.store.clear_and_cleanup()  # Use cleanup version to break circular refs
+
+        # Refuse parameter choices that would OOM the worker: there is
+        # no recovery path once generation starts swapping
+        projected_mb = estimated_elephants * 0.05 + num_events * 0.002
+        available_mb = psutil.virtual_memory().available / (1024 * 1024)
+        too_large = projected_mb > 0.8 * available_mb
+        if too_large:
+            st.error(
+                f"⛔ Projected ~{projected_mb:,.0f} MB exceeds 80% of available "
+                f"RAM ({available_mb:,.0f} MB). Reduce the parameters."
+            )
+
+        if st.button("🚀 Generate Large Dataset", type="primary", use_container_width=True,
+                     disabled=too_large):
+            # Drop the old dataset from the store. clear() (not
+            # clear_and_cleanup()) so cached object graphs from earlier
+            # parameter sets stay intact for instant cache hits.
+            st.session_state.store.clear()
             st.session_state.search_engine.index_all([], [], [])  # Clear search indexes
+            # Evict the superseded dataset's genealogy aggregates: the
+            # cache is keyed on dataset_version, so old entries would
+            # otherwise pin the previous object graph forever
+            _build_family_index.clear()
+            _family_csr.clear()
+            _family_tree_figure.clear()
             gc.collect()
             st.session_state.references_broken = False  # Reset state
-            
-            with st.spinner("Generating large dataset..."):
+
+            # st.status coalesces the per-phase feedback into one widget
+            # instead of a separate frontend message per progress tick
+            with st.status("Generating large dataset...", expanded=True) as status:
                 snapshot_before = st.session_state.monitor.take_snapshot("Before generation")
-                
-                # Generate data
-                progress_bar = st.progress(0)
-                
-                # Generate families (50% of progress)
-                elephants = DataGenerator.generate_multiple_families(
+
+                status.update(label="Generating families, herds, and events...")
+                elephants, herds, events, water_sources = _generate_dataset(
                     num_families=num_families,
                     generations=generations,
-                    children_per_elephant=children_per_elephant
+                    children_per_elephant=children_per_elephant,
+                    num_herds=num_herds,
+                    num_events=num_events,
+                    seed=seed
+                )
+
+                # Add to store in a single bulk operation
+                st.session_state.store.bulk_load(
+                    elephants=elephants,
+                    herds=herds,
+                    events=events,
+                    water_sources=water_sources
                 )
-                progress_bar.progress(50)
-                
-                # Generate herds (70%)
-                herds = DataGenerator.generate_herds(num_herds)
-                progress_bar.progress(70)
-                
-                # Assign elephants to herds (80%)
-                DataGenerator.assign_elephants_to_herds(elephants, herds)
-                progress_bar.progress(80)
-                
-                # Generate water sources (85%)
-                water_sources = DataGenerator.generate_water_sources()
-                progress_bar.progress(85)
-                
-                # Generate events (95%)
-                events = DataGenerator.generate_events(elephants, herds, num_events)
-                progress_bar.progress(95)
-                
-                # Add to store
-                st.session_state.store.add_elephants(elephants)
-                st.session_state.store.add_herds(herds)
-                st.session_state.store.add_events(events)
-                st.session_state.store.add_water_sources(water_sources)
                 
                 # Build search indexes
+                status.update(label="Building search indexes...")
                 st.session_state.search_engine.index_all(elephants, events, herds)
-                progress_bar.progress(100)
-                
+
                 snapshot_after = st.session_state.monitor.take_snapshot("After generation")
                 st.session_state.large_dataset_generated = True
-                
-                # Force GC to see circular references
-                gc.collect()
-                
+                st.session_state.dataset_version += 1
+                st.session_state.heap_object_count = len(gc.get_objects())
+                # Cache derived UI data once per dataset instead of rebuilding
+                # it on every script rerun
+                st.session_state.elephant_name_sample = [e.name for e in elephants[:100]]
+
+                # Pin the loaded archive in the GC's permanent
+                # generation. The collect inside freeze_bootstrap runs
+                # once here, under the status spinner, instead of a
+                # full-dataset rescan on every later gen-2 pass; the
+                # store unfreezes again when the data is cleared.
+                status.update(label="Freezing dataset for the GC...")
+                st.session_state.store.freeze_bootstrap()
+                status.update(label="Generation complete", state="complete")
+
                 st.success(f"""
                 ✅ **Dataset Generated Successfully!**
                 - **{len(elephants):,}** elephants with circular parent-child references
@@ -452,21 +942,191 @@ with tab2:
     
     with col2:
         st.subheader("Current Dataset")
-        stats = st.session_state.store.get_stats()
-        
-        st.metric("Elephants", f"{stats['total_elephants']:,}")
-        st.metric("Herds", stats['total_herds'])
-        st.metric("Events", f"{stats['total_events']:,}")
-        st.metric("Water Sources", stats['total_water_sources'])
-        st.metric("Circular References", f"{stats['circular_references']:,}")
-        
-        if stats['total_elephants'] > 0 and st.button("💾 Export to JSON"):
+
+        st.metric("Elephants", f"{store_stats['total_elephants']:,}")
+        st.metric("Herds", store_stats['total_herds'])
+        st.metric("Events", f"{store_stats['total_events']:,}")
+        st.metric("Water Sources", store_stats['total_water_sources'])
+        st.metric("Circular References", f"{store_stats['circular_references']:,}")
+
+        if store_stats['total_elephants'] > 0 and st.button("💾 Export to JSON"):
             try:
                 st.session_state.store.export_to_json("data/exported_data.json")
                 st.success("✅ Exported successfully")
             except Exception as e:
                 st.error(f"❌ Export failed: {e}")
 
+# ============================================================================
+# TAB 3 search panels. Each panel is a fragment: interacting with its
+# widgets reruns only that panel, not the whole script — in particular
+# not the tab4 genealogy build.
+# ============================================================================
+
+@st.fragment
+def _search_nearest_water():
+    st.subheader("Find Nearest Water Source")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        lat = st.number_input("Latitude", value=-19.0, min_value=-25.0, max_value=-15.0, step=0.1)
+    with col2:
+        lon = st.number_input("Longitude", value=23.0, min_value=20.0, max_value=30.0, step=0.1)
+    with col3:
+        year = st.number_input("Year (optional)", value=2025, min_value=2000, max_value=2026)
+
+    if st.button("🔍 Find Water"):
+        source = st.session_state.search_engine.find_nearest_water(lat, lon, year)
+        if source:
+            distance = source.distance_to(lat, lon)
+            st.success(f"""
+            **{source.name}** 🌊
+            - Distance: {distance:.2f} units
+            - Capacity: {source.capacity}
+            - Available in {year}: {'✅ Yes' if source.was_available(year) else '❌ No'}
+            """)
+        else:
+            st.error("No water sources found")
+
+
+@st.fragment
+def _search_drought_history():
+    st.subheader("Search Drought Years")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        start_year = st.number_input("Start Year", value=2000, min_value=2000, max_value=2025)
+    with col2:
+        end_year = st.number_input("End Year", value=2025, min_value=2000, max_value=2026)
+
+    if st.button("🔍 Search Droughts"):
+        results = _cached_search_droughts(
+            st.session_state.dataset_version, start_year, end_year
+        )
+
+        if results:
+            st.warning(f"Found droughts at {len(results)} water sources:")
+            # One markdown call instead of one widget per source
+            st.markdown("\n".join(
+                f"- **{source_name}**: {', '.join(map(str, years))}"
+                for source_name, years in results.items()
+            ))
+        else:
+            st.success("No droughts found in this period!")
+
+
+@st.fragment
+def _search_events_by_year():
+    st.subheader("Search Events by Year")
+
+    year = st.number_input("Year", value=2020, min_value=2000, max_value=2025)
+
+    if st.button("🔍 Search"):
+        events = st.session_state.search_engine.search_by_year(year)
+        st.info(f"Found {len(events)} events in {year}")
+
+        if events:
+            type_counts = _cached_year_type_counts(st.session_state.dataset_version, year)
+            event_types = list(type_counts.keys())
+            counts = list(type_counts.values())
+
+            go = _go()
+            fig = go.Figure(data=[
+                go.Bar(
+                    x=event_types,
+                    y=counts,
+                    marker=dict(
+                        color=CHART_COLORS[:len(event_types)]
+                    ),
+                    text=counts,
+                    textposition='auto',
+                )
+            ])
+
+            fig.update_layout(
+                title=f"Event Distribution in {year}",
+                xaxis_title="Event Type",
+                yaxis_title="Count",
+                height=400,
+                showlegend=False
+            )
+
+            st.plotly_chart(fig, use_container_width=True)
+
+            # Show all events (one markdown call, not one per event)
+            with st.expander(f"Show all {len(events)} events"):
+                st.markdown("\n".join(
+                    f"- **{event.event_type.label}** at {event.location}"
+                    for event in events
+                ))
+        else:
+            st.warning(f"No events found in {year}")
+
+
+@st.fragment
+def _search_elephant_timeline():
+    st.subheader("Elephant Timeline")
+
+    elephant_names = st.session_state.elephant_name_sample  # First 100, cached per dataset
+    if elephant_names:
+        selected_name = st.selectbox("Select Elephant", elephant_names)
+
+        if st.button("🔍 Get Timeline"):
+            timeline = st.session_state.search_engine.get_elephant_timeline(selected_name)
+
+            if timeline:
+                st.markdown(f"### 🐘 {selected_name}")
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    st.metric("Born", timeline['birth_year'])
+                with col2:
+                    st.metric("Children", timeline['num_children'])
+                with col3:
+                    st.metric("Events", timeline['event_count'])
+
+                if timeline['parent']:
+                    st.info(f"Parent: {timeline['parent']}")
+
+                if timeline['events']:
+                    st.markdown("**Event Timeline:**\n" + "\n".join(
+                        f"- **{event.year}**: {event.event_type.label} at {event.location}"
+                        for event in timeline['events'][:10]
+                    ))
+
+
+@st.fragment
+def _search_migration_alerts():
+    st.subheader("Migration Anniversary Alerts")
+
+    alerts = _cached_migration_alerts(st.session_state.dataset_version)
+
+    if alerts:
+        st.info(f"Found {len(alerts)} migration anniversaries:")
+        st.markdown("  \n".join(
+            f"🔔 **{description}**" for description, years_ago in alerts
+        ))
+    else:
+        st.warning("No migration anniversaries found")
+
+
+@st.fragment
+def _search_stats():
+    st.subheader("Search Engine Statistics")
+
+    stats = st.session_state.search_engine.get_search_statistics()
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Indexed", "✅ Yes" if stats['indexed'] else "❌ No")
+        st.metric("Total Events", f"{stats['total_events']:,}")
+    with col2:
+        st.metric("Years Covered", stats['years_covered'])
+        st.metric("Elephants", f"{stats['elephants_indexed']:,}")
+    with col3:
+        st.metric("Herds", stats['herds_indexed'])
+        st.metric("Event Types", stats['event_types'])
+
+
 # ============================================================================
 # TAB 3: Search Engine
 # ============================================================================
@@ -486,147 +1146,17 @@ with tab3:
         st.divider()
         
         if search_type == "📍 Nearest Water Source":
-            st.subheader("Find Nearest Water Source")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                lat = st.number_input("Latitude", value=-19.0, min_value=-25.0, max_value=-15.0, step=0.1)
-            with col2:
-                lon = st.number_input("Longitude", value=23.0, min_value=20.0, max_value=30.0, step=0.1)
-            with col3:
-                year = st.number_input("Year (optional)", value=2025, min_value=2000, max_value=2026)
-            
-            if st.button("🔍 Find Water"):
-                source = st.session_state.search_engine.find_nearest_water(lat, lon, year)
-                if source:
-                    distance = source.distance_to(lat, lon)
-                    st.success(f"""
-                    **{source.name}** 🌊
-                    - Distance: {distance:.2f} units
-                    - Capacity: {source.capacity}
-                    - Available in {year}: {'✅ Yes' if source.was_available(year) else '❌ No'}
-                    """)
-                else:
-                    st.error("No water sources found")
-        
+            _search_nearest_water()
         elif search_type == "🏜️ Drought History":
-            st.subheader("Search Drought Years")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                start_year = st.number_input("Start Year", value=2000, min_value=2000, max_value=2025)
-            with col2:
-                end_year = st.number_input("End Year", value=2025, min_value=2000, max_value=2026)
-            
-            if st.button("🔍 Search Droughts"):
-                results = st.session_state.search_engine.search_droughts(start_year, end_year)
-                
-                if results:
-                    st.warning(f"Found droughts at {len(results)} water sources:")
-                    for source_name, years in results.items():
-                        st.markdown(f"**{source_name}**: {', '.join(map(str, years))}")
-                else:
-                    st.success("No droughts found in this period!")
-        
+            _search_drought_history()
         elif search_type == "📅 Events by Year":
-            st.subheader("Search Events by Year")
-            
-            year = st.number_input("Year", value=2020, min_value=2000, max_value=2025)
-            
-            if st.button("🔍 Search"):
-                events = st.session_state.search_engine.search_by_year(year)
-                st.info(f"Found {len(events)} events in {year}")
-                
-                if events:
-                    type_counts = Counter(e.event_type.value for e in events)
-                    event_types = list(type_counts.keys())
-                    counts = list(type_counts.values())
-                    
-                    fig = go.Figure(data=[
-                        go.Bar(
-                            x=event_types,
-                            y=counts,
-                            marker=dict(
-                                color=CHART_COLORS[:len(event_types)]
-                            ),
-                            text=counts,
-                            textposition='auto',
-                        )
-                    ])
-                    
-                    fig.update_layout(
-                        title=f"Event Distribution in {year}",
-                        xaxis_title="Event Type",
-                        yaxis_title="Count",
-                        height=400,
-                        showlegend=False
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Show all events
-                    with st.expander(f"Show all {len(events)} events"):
-                        for event in events:
-                            st.markdown(f"**{event.event_type.value}** at {event.location}")
-                else:
-                    st.warning(f"No events found in {year}")
-        
+            _search_events_by_year()
         elif search_type == "🐘 Elephant Timeline":
-            st.subheader("Elephant Timeline")
-            
-            elephant_names = [e.name for e in st.session_state.store.elephants[:100]]  # Show first 100
-            if elephant_names:
-                selected_name = st.selectbox("Select Elephant", elephant_names)
-                
-                if st.button("🔍 Get Timeline"):
-                    timeline = st.session_state.search_engine.get_elephant_timeline(selected_name)
-                    
-                    if timeline:
-                        st.markdown(f"### 🐘 {selected_name}")
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            st.metric("Born", timeline['birth_year'])
-                        with col2:
-                            st.metric("Children", timeline['num_children'])
-                        with col3:
-                            st.metric("Events", timeline['event_count'])
-                        
-                        if timeline['parent']:
-                            st.info(f"Parent: {timeline['parent']}")
-                        
-                        if timeline['events']:
-                            st.markdown("**Event Timeline:**")
-                            for event in timeline['events'][:10]:
-                                st.markdown(f"- **{event.year}**: {event.event_type.value} at {event.location}")
-        
+            _search_elephant_timeline()
         elif search_type == "🔔 Migration Alerts":
-            st.subheader("Migration Anniversary Alerts")
-            
-            alerts = st.session_state.search_engine.get_migration_alerts()
-            
-            if alerts:
-                st.info(f"Found {len(alerts)} migration anniversaries:")
-                for description, years_ago in alerts:
-                    st.markdown(f"🔔 **{description}**")
-            else:
-                st.warning("No migration anniversaries found")
-        
+            _search_migration_alerts()
         elif search_type == "📊 Search Stats":
-            st.subheader("Search Engine Statistics")
-            
-            stats = st.session_state.search_engine.get_search_statistics()
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Indexed", "✅ Yes" if stats['indexed'] else "❌ No")
-                st.metric("Total Events", f"{stats['total_events']:,}")
-            with col2:
-                st.metric("Years Covered", stats['years_covered'])
-                st.metric("Elephants", f"{stats['elephants_indexed']:,}")
-            with col3:
-                st.metric("Herds", stats['herds_indexed'])
-                st.metric("Event Types", stats['event_types'])
+            _search_stats()
 
 # ============================================================================
 # TAB 4: Elephant Genealogy & Relationships
@@ -638,38 +1168,18 @@ with tab4:
         st.info("🐘 Generate a dataset first to explore elephant families and relationships")
     else:
         elephants = st.session_state.store.elephants
-        
-        # Calculate family statistics
-        families = {}
-        generations = {}
-        orphans = []
-        max_depth = 0
-        
-        for elephant in elephants:
-            # Find root ancestor
-            root = elephant
-            depth = 0
-            while root.parent and depth < 100:  # Prevent infinite loops
-                root = root.parent
-                depth += 1
-            
-            # Warn if we hit the depth limit (possible data corruption)
-            if depth >= 100:
-                st.warning(f"⚠️ Elephant {elephant.name} has ancestry depth ≥100. Possible circular reference in parent chain.")
-            
-            max_depth = max(max_depth, depth)
-            
-            if root.name not in families:
-                families[root.name] = []
-            families[root.name].append(elephant)
-            
-            # Track generation depth
-            generations[elephant.name] = depth
-            
-            # Find orphans (no parent, but not a root with children)
-            if not elephant.parent and len(elephant.children) == 0:
-                orphans.append(elephant)
-        
+        go = _go()  # Charts below; deferred import (see helper)
+
+        # Family statistics, computed once per dataset (see builder above)
+        family_index = _build_family_index(st.session_state.dataset_version)
+        families = family_index['families']
+        generations = family_index['generations']
+        orphans = family_index['orphans']
+        max_depth = family_index['max_depth']
+
+        for name in family_index['depth_warnings']:
+            st.warning(f"⚠️ Elephant {name} has ancestry depth ≥100. Possible circular reference in parent chain.")
+
         # Overview metrics
         st.subheader("📊 Family Overview")
         col1, col2, col3, col4, col5 = st.columns(5)
@@ -682,7 +1192,9 @@ with tab4:
         with col3:
             st.metric("🔢 Max Generation Depth", max_depth)
         with col4:
-            total_circular_refs = sum(1 for e in elephants if e.parent)
+            # Every parent→child link is mirrored child→parent, so the
+            # total child count equals the number of circular pairs
+            total_circular_refs = int(family_index['kids'].sum())
             st.metric("♻️ Circular Refs", f"{total_circular_refs:,}")
         with col5:
             st.metric("🍃 Orphans", len(orphans))
@@ -695,162 +1207,76 @@ with tab4:
         col_left, col_right = st.columns([2, 1])
         
         with col_left:
-            # Sort families by size
-            sorted_families = sorted(families.items(), key=lambda x: len(x[1]), reverse=True)
-            family_options = [f"{root} ({len(members)} elephants)" for root, members in sorted_families]
-            
+            # Presorted at index-build time; the UI just reads it
+            family_options = family_index['family_options']
+
             if family_options:
                 selected_family = st.selectbox("Select a Family", family_options)
                 selected_root = selected_family.split(" (")[0]
-                
-                # Get the family
-                family_members = families[selected_root]
-                root_elephant = next(e for e in family_members if e.name == selected_root)
-                
+
                 # Display family tree as hierarchical chart
                 st.markdown("### 🌳 Family Tree")
-                
-                # Build graph structure using dictionaries
-                nodes = {}  # {name: {generation, birth_year, num_children}}
-                edges = []  # [(parent_name, child_name), ...]
-                
-                def add_to_graph(elephant, generation=0):
-                    """Recursively add elephant and children to graph"""
-                    nodes[elephant.name] = {
-                        'generation': generation,
-                        'birth_year': elephant.birth_year,
-                        'num_children': len(elephant.children)
-                    }
-                    
-                    for child in elephant.children:
-                        edges.append((elephant.name, child.name))
-                        add_to_graph(child, generation + 1)
-                
-                add_to_graph(root_elephant)
-                
-                # Use hierarchical layout - position nodes by generation
-                pos = {}
-                generation_nodes = {}
-                
-                # Group nodes by generation
-                for node_name, node_data in nodes.items():
-                    gen = node_data['generation']
-                    if gen not in generation_nodes:
-                        generation_nodes[gen] = []
-                    generation_nodes[gen].append(node_name)
-                
-                # Position nodes: y by generation, x spread evenly
-                for gen, node_list in generation_nodes.items():
-                    y = -gen * 100  # Vertical spacing
-                    width = len(node_list)
-                    for i, node_name in enumerate(node_list):
-                        # Center the nodes horizontally
-                        x = (i - width/2) * 150  # Horizontal spacing
-                        pos[node_name] = (x, y)
-                
-                # Create edges
-                edge_x = []
-                edge_y = []
-                for parent, child in edges:
-                    x0, y0 = pos[parent]
-                    x1, y1 = pos[child]
-                    edge_x.extend([x0, x1, None])
-                    edge_y.extend([y0, y1, None])
-                
-                edge_trace = go.Scatter(
-                    x=edge_x, y=edge_y,
-                    line=dict(width=2, color='#95a5a6'),
-                    hoverinfo='none',
-                    mode='lines'
-                )
-                
-                # Create nodes with generation-based colors
-                node_x = []
-                node_y = []
-                node_text = []
-                node_color = []
-                node_hover = []
-                
-                for node_name, node_data in nodes.items():
-                    x, y = pos[node_name]
-                    node_x.append(x)
-                    node_y.append(y)
-                    
-                    generation = node_data['generation']
-                    birth_year = node_data['birth_year']
-                    num_children = node_data['num_children']
-                    
-                    # Short name for display
-                    short_name = node_name.split('_')[0] if '_' in node_name else node_name[:8]
-                    node_text.append(short_name)
-                    
-                    # Color by generation
-                    node_color.append(CHART_COLORS[generation % len(CHART_COLORS)])
-                    
-                    # Hover info
-                    node_hover.append(f"<b>{node_name}</b><br>Born: {birth_year}<br>Children: {num_children}<br>Generation: {generation}")
-                
-                node_trace = go.Scatter(
-                    x=node_x, y=node_y,
-                    mode='markers+text',
-                    hoverinfo='text',
-                    text=node_text,
-                    hovertext=node_hover,
-                    textposition="bottom center",
-                    textfont=dict(size=10),
-                    marker=dict(
-                        color=node_color,
-                        size=20,
-                        line=dict(width=2, color='white')
+
+                if len(family_index['families'][selected_root]) <= 1:
+                    # Nothing to draw — skip the figure build and the
+                    # plotly serialization round-trip entirely
+                    st.info("Single elephant family — no tree to display")
+                else:
+                    show_all = st.toggle(
+                        "Show all generations",
+                        value=False,
+                        help="Plot every elephant even in very large families "
+                             "(slower; large trees are otherwise capped at "
+                             "1,500 nodes with collapsed subtree markers)"
                     )
-                )
-                
-                # Display family tree
-                st.plotly_chart(
-                    go.Figure(data=[edge_trace, node_trace],
-                        layout=go.Layout(
-                            title=f"Family Tree: {selected_root} ({len(family_members)} elephants)",
-                            showlegend=False,
-                            hovermode='closest',
-                            margin=dict(b=20,l=20,r=20,t=60),
-                            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                            height=600
-                        )
-                    ),
-                    use_container_width=True
-                )
-                st.caption("🎨 Colors represent different generations | Hover over nodes for details")
+
+                    # Figure build + plotly serialization are cached per
+                    # (dataset, family, budget); a rerun with the same
+                    # selection reuses the finished figure
+                    st.plotly_chart(
+                        _family_tree_figure(
+                            st.session_state.dataset_version, selected_root,
+                            max_nodes=None if show_all else 1500
+                        ),
+                        use_container_width=True
+                    )
+                    st.caption("🎨 Colors represent different generations | Hover over nodes for details")
         
         with col_right:
             st.markdown("### 📊 Family Statistics")
             
-            # Generation distribution
-            gen_counts = Counter(generations.values())
+            # Generation distribution: C-level histogram over the depth
+            # column; indices double as the sorted generation labels
+            gen_counts = np.bincount(family_index['gens_np'])
             st.markdown("**Generation Distribution:**")
-            for gen in sorted(gen_counts.keys()):
-                st.metric(f"Generation {gen}", gen_counts[gen])
+            for gen, count in enumerate(gen_counts):
+                if count:
+                    st.metric(f"Generation {gen}", int(count))
         
         st.divider()
         
         # Relationship Analysis
         st.subheader("🔍 Relationship Analysis")
         
-        # Combined metrics for both children and age
-        avg_children = sum(len(e.children) for e in elephants) / len(elephants)
+        # Combined metrics for both children and age, as O(1) array
+        # reductions over the cached columnar views
+        births = family_index['births']
+        kids = family_index['kids']
+        avg_children = float(kids.mean()) if kids.size else 0.0
         current_year = 2026
-        valid_elephants = [e for e in elephants if e.birth_year <= current_year]
-        
-        if valid_elephants:
-            ages = [current_year - e.birth_year for e in valid_elephants]
-            oldest = max(valid_elephants, key=lambda e: current_year - e.birth_year)
-            youngest = min(valid_elephants, key=lambda e: current_year - e.birth_year)
-            
+        valid_idx = np.flatnonzero(births <= current_year)
+
+        if valid_idx.size:
+            valid_births = births[valid_idx]
+            ages = current_year - valid_births
+            oldest = elephants[valid_idx[valid_births.argmin()]]
+            youngest = elephants[valid_idx[valid_births.argmax()]]
+
             col_m1, col_m2, col_m3, col_m4 = st.columns(4)
             with col_m1:
                 st.metric("Average Children", f"{avg_children:.2f}")
             with col_m2:
-                st.metric("Average Age", f"{sum(ages) / len(ages):.1f} years")
+                st.metric("Average Age", f"{ages.mean():.1f} years")
             with col_m3:
                 st.success(f"🧓 **{oldest.name}**\n\n{current_year - oldest.birth_year} years")
             with col_m4:
@@ -861,12 +1287,10 @@ with tab4:
         with col_a:
             st.markdown("### 👨‍👩‍👧‍👦 Children Distribution")
             
-            children_dist = Counter(len(e.children) for e in elephants)
-            
-            # Get all possible child counts from 0 to max
-            max_children_count = max(len(e.children) for e in elephants)
-            child_counts = list(range(max_children_count + 1))
-            elephant_counts = [children_dist.get(c, 0) for c in child_counts]
+            # bincount covers every child count from 0 to max in one shot
+            children_dist = np.bincount(kids)
+            child_counts = list(range(children_dist.size))
+            elephant_counts = children_dist.tolist()
             
             fig = go.Figure(data=[
                 go.Bar(
@@ -894,10 +1318,12 @@ with tab4:
         with col_b:
             st.markdown("### 📅 Age Distribution")
             
-            # Birth year distribution
-            birth_years = Counter(e.birth_year for e in elephants)
-            years = sorted(birth_years.keys())
-            born_counts = [birth_years[y] for y in years]
+            # Birth year distribution: bincount over the offset years
+            # yields the histogram already in year order, no sort needed
+            min_year = int(births.min())
+            counts = np.bincount(births - min_year)
+            years = np.arange(min_year, min_year + counts.size).tolist()
+            born_counts = counts.tolist()
             
             fig = go.Figure()
             
@@ -929,8 +1355,11 @@ with tab4:
             st.warning(f"Found {len(orphans)} orphaned elephants (no parents, no children)")
             
             with st.expander("View Orphans"):
-                for orphan in orphans[:20]:
-                    st.caption(f"🐘 {orphan.name} (Born: {orphan.birth_year})")
+                # One markdown call instead of one caption per orphan
+                st.markdown("  \n".join(
+                    f"🐘 {orphan.name} (Born: {orphan.birth_year})"
+                    for orphan in orphans[:20]
+                ))
 
 # Footer
 st.divider()
@@ -5,6 +5,7 @@ Demonstrates circular references in complex relationship graphs.
 
 import random
 from typing import List, Tuple
+import numpy as np
 from models.elephant import Elephant
 from models.herd import Herd
 from models.event import Event, EventType
@@ -40,21 +41,26 @@ class DataGenerator:
     ]
     
     @staticmethod
-    def generate_herds(count: int = 10) -> List[Herd]:
+    def generate_herds(count: int = 10, rng: np.random.Generator = None) -> List[Herd]:
         """
         Generate multiple herds.
-        
+
         Args:
             count: Number of herds to generate
-            
+            rng: Seeded generator for reproducible draws
+
         Returns:
             List of Herd objects
         """
+        if rng is None:
+            rng = np.random.default_rng()
         herds = []
+        # One batched draw instead of a random.choice call per herd
+        territory_idx = rng.integers(0, len(DataGenerator.TERRITORIES), count)
         for i in range(count):
             herd = Herd(
                 name=f"Herd_{chr(65+i)}_{i+1}",  # Herd_A_1, Herd_B_2, etc.
-                territory=random.choice(DataGenerator.TERRITORIES)
+                territory=DataGenerator.TERRITORIES[territory_idx[i]]
             )
             herds.append(herd)
         return herds
@@ -80,35 +86,41 @@ class DataGenerator:
         Returns:
             Tuple of (root elephant, list of all elephants)
         """
-        all_elephants = []
-        
-        def create_generation(parent: Elephant, current_gen: int, max_gen: int):
-            """Recursively create generations with circular references."""
-            if current_gen >= max_gen:
-                return
-            
-            num_children = random.randint(1, children_per_elephant + 1)
-            birth_year = start_year + (current_gen * 15)
-            
-            for i in range(num_children):
-                name = f"{random.choice(DataGenerator.ELEPHANT_NAMES)}_G{current_gen}_{random.randint(100,999)}"
-                gender = random.choice(['M', 'F'])
-                
-                child = Elephant(name, birth_year, gender)
-                parent.add_child(child)  # Creates circular reference: parent → child, child → parent
-                all_elephants.append(child)
-                
-                # Recursively create next generation
-                create_generation(child, current_gen + 1, max_gen)
-        
-        # Create matriarch
-        matriarch = Elephant(root_name, start_year, "F")
-        all_elephants.append(matriarch)
-        
-        # Generate family tree
-        create_generation(matriarch, 1, generations)
-        
-        return matriarch, all_elephants
+        # Hoisted out of the per-node loops: each dotted lookup costs a
+        # dict probe, and these run once per elephant
+        _names = DataGenerator.ELEPHANT_NAMES
+        _choice = random.choice
+        _randint = random.randint
+
+        # Phase 1: generate the tree topology as flat parent-index and
+        # generation lists. No Elephant objects (and no circular refs)
+        # exist yet, so this loop is cheap integer work with no recursion.
+        parent_idx = [-1]
+        node_gen = [0]
+        cursor = 0
+        while cursor < len(parent_idx):
+            child_gen = node_gen[cursor] + 1
+            if child_gen < generations:
+                for _ in range(_randint(1, children_per_elephant + 1)):
+                    parent_idx.append(cursor)
+                    node_gen.append(child_gen)
+            cursor += 1
+
+        # Phase 2: allocate all Elephant objects in one sweep, then wire
+        # up the circular parent/child references from the arrays
+        all_elephants = [Elephant(root_name, start_year, "F")]
+        for gen in node_gen[1:]:
+            name = f"{_choice(_names)}_G{gen}_{_randint(100, 999)}"
+            all_elephants.append(
+                Elephant(name, start_year + (gen * 15), _choice(['M', 'F']))
+            )
+
+        for i, parent in enumerate(parent_idx):
+            if parent >= 0:
+                # Creates circular reference: parent → child, child → parent
+                all_elephants[parent].add_child(all_elephants[i])
+
+        return all_elephants[0], all_elephants
     
     @staticmethod
     def generate_multiple_families(
@@ -175,41 +187,57 @@ class DataGenerator:
     def generate_events(
         elephants: List[Elephant],
         herds: List[Herd],
-        count: int = 500
+        count: int = 500,
+        rng: np.random.Generator = None
     ) -> List[Event]:
         """
         Generate historical events linking elephants and herds.
-        
+
         Args:
             elephants: List of available elephants
             herds: List of available herds
             count: Number of events to generate
-            
+            rng: Seeded generator for reproducible draws
+
         Returns:
             List of Event objects
         """
         events = []
-        
+
         if not elephants or not herds:
             return events
-        
+
+        # Draw all per-event randomness in batched C-level calls instead
+        # of 4+ interpreter-bound random.* calls per event
+        if rng is None:
+            rng = np.random.default_rng()
+        years = rng.integers(2000, 2026, count)
+        type_codes = rng.integers(0, len(EventType), count)
+        lats = rng.uniform(-20.5, -17.5, count).round(2)
+        lons = rng.uniform(22.0, 25.5, count).round(2)
+        num_involved = rng.integers(1, 9, count).clip(max=len(elephants))
+        num_herds_arr = rng.integers(1, 4, count).clip(max=len(herds))
+        event_types = list(EventType)
+
         for i in range(count):
-            event_type = random.choice(list(EventType))
-            year = random.randint(2000, 2025)
-            
-            # Generate random location in southern Africa
-            lat = round(random.uniform(-20.5, -17.5), 2)
-            lon = round(random.uniform(22.0, 25.5), 2)
-            location = f"{lat}, {lon}"
-            
-            # Randomly select involved elephants and herds
-            num_elephants = min(random.randint(1, 8), len(elephants))
-            num_herds = min(random.randint(1, 3), len(herds))
-            
-            involved = random.sample(elephants, num_elephants)
-            involved_herds = random.sample(herds, num_herds)
+            event_type = event_types[type_codes[i]]
+            year = int(years[i])
+
+            # Random location in southern Africa (pre-drawn above)
+            location = f"{float(lats[i])}, {float(lons[i])}"
+
+            # Sample participants by index; rng.choice without
+            # replacement does the dedup work in C
+            involved = [
+                elephants[j]
+                for j in rng.choice(len(elephants), num_involved[i], replace=False)
+            ]
+            involved_herds = [
+                herds[j]
+                for j in rng.choice(len(herds), num_herds_arr[i], replace=False)
+            ]
             
-            description = f"{event_type.value} at {location} in {year}"
+            description = f"{event_type.label} at {location} in {year}"
             
             event = Event(
                 event_type=event_type,
@@ -225,18 +253,26 @@ class DataGenerator:
         return events
     
     @staticmethod
-    def assign_elephants_to_herds(elephants: List[Elephant], herds: List[Herd]):
+    def assign_elephants_to_herds(
+        elephants: List[Elephant],
+        herds: List[Herd],
+        rng: np.random.Generator = None
+    ):
         """
         Distribute elephants across herds, creating more circular references.
-        
+
         Args:
             elephants: List of elephants
             herds: List of herds
+            rng: Seeded generator for reproducible draws
         """
         if not elephants or not herds:
             return
-        
-        for elephant in elephants:
-            # Assign to random herd
-            herd = random.choice(herds)
-            herd.add_member(elephant)
+
+        if rng is None:
+            rng = np.random.default_rng()
+        # Draw every herd assignment in one C-level batch; the loop
+        # only does the membership wiring
+        herd_idx = rng.integers(0, len(herds), len(elephants))
+        for elephant, hi in zip(elephants, herd_idx):
+            herds[hi].add_member(elephant)
@@ -2,30 +2,47 @@
 
 import psutil
 import os
+import time
 
 
 class MemoryMonitor:
     """Monitor process memory usage."""
-    
+
     def __init__(self):
         self.snapshots = []
-    
+        self._process = psutil.Process(os.getpid())
+        # Debounce window: RSS reads are a syscall each, and the
+        # dashboard asks several times per rerun
+        self._last_mb = 0.0
+        self._last_t = float('-inf')
+
     def take_snapshot(self, label: str = ""):
         """
         Take a memory snapshot.
-        
+
         Args:
             label: Description of this snapshot point
         """
         snapshot = {
             'label': label,
-            'process_memory_mb': self.get_process_memory_mb()
+            # Snapshots are deliberate measurements; never reuse a stale read
+            'process_memory_mb': self.get_process_memory_mb(max_age_s=0.0)
         }
         self.snapshots.append(snapshot)
         return snapshot
-    
-    @staticmethod
-    def get_process_memory_mb() -> float:
-        """Get current process memory usage in MB."""
-        process = psutil.Process(os.getpid())
-        return process.memory_info().rss / 1024 / 1024
+
+    def get_process_memory_mb(self, max_age_s: float = 1.0) -> float:
+        """
+        Get current process memory usage in MB.
+
+        Reuses the previous reading if it is younger than max_age_s;
+        pass max_age_s=0.0 to force a fresh syscall (e.g. for
+        before/after comparisons).
+        """
+        now = time.monotonic()
+        if now - self._last_t >= max_age_s:
+            # oneshot() batches the underlying /proc reads
+            with self._process.oneshot():
+                self._last_mb = self._process.memory_info().rss / (1 << 20)
+            self._last_t = now
+        return self._last_mb
@@ -3,8 +3,13 @@ In-memory object store for elephant archive.
 Manages all elephants, herds, events, and water sources in RAM.
 """
 
-from typing import List, Optional, Dict, Any
-import json
+from typing import List, Optional, Dict, Any, Tuple
+from collections import defaultdict
+from contextlib import contextmanager
+import gc
+import math
+import numpy as np
+import orjson
 from pathlib import Path
 from models.elephant import Elephant
 from models.herd import Herd
@@ -24,97 +29,290 @@ class MemoryStore:
         self.events: List[Event] = []
         self.water_sources: List[WaterSource] = []
         self._elephant_by_name: Dict[str, Elephant] = {}
+        # Monotonic version, bumped on every mutation; lets get_stats()
+        # (and external caches) detect unchanged state in O(1)
+        self._version = 0
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_version = -1
+        # Columnar (SoA) views over the elephant objects for bulk
+        # analytics; rebuilt lazily when the version moves on
+        self._columns_cache: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._columns_cache_version = -1
+        self._circular_count = 0
+        self._circular_count_version = -1
+        # Event bucket indexes (year/type/involved elephant), owned by
+        # the store so clearing it actually releases the events; rebuilt
+        # lazily when the version moves on
+        self._events_by_year: Dict[int, List[Event]] = {}
+        self._events_by_type: Dict[Any, List[Event]] = {}
+        self._events_by_elephant: Dict[int, List[Event]] = {}
+        self._event_index_version = -1
+
+    def _elephant_columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Rebuild the columnar elephant views if the store changed."""
+        if self._columns_cache_version != self._version:
+            n = len(self.elephants)
+            # Years fit in int16 and child counts in uint16; the
+            # narrower dtypes halve the columns' footprint and double
+            # how many values fit per cache line in the stat reductions
+            self._columns_cache = (
+                np.fromiter(
+                    (e.birth_year for e in self.elephants), dtype=np.int16, count=n
+                ),
+                np.fromiter(
+                    (len(e.children) for e in self.elephants), dtype=np.uint16, count=n
+                ),
+            )
+            self._columns_cache_version = self._version
+        return self._columns_cache
+
+    @property
+    def birth_years_np(self) -> np.ndarray:
+        """Birth years of all stored elephants as a tight int16 array."""
+        return self._elephant_columns()[0]
+
+    @property
+    def child_counts_np(self) -> np.ndarray:
+        """Child counts of all stored elephants as a tight uint16 array."""
+        return self._elephant_columns()[1]
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter identifying the current store contents."""
+        return self._version
+
+    def _mark_dirty(self):
+        """Invalidate cached derived data after a mutation."""
+        self._version += 1
+
+    @contextmanager
+    def _gc_paused(self):
+        """
+        Pause automatic garbage collection for a bulk insert.
+
+        Appending thousands of cyclic objects trips the gen-0 threshold
+        every ~700 allocations, and each pass rescans the live heap;
+        pausing the collector turns that into zero sweeps for the whole
+        batch. Re-enables only if it was enabled on entry, so nested
+        pauses compose.
+        """
+        was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            yield
+        finally:
+            if was_enabled:
+                gc.enable()
+
+    def _retune_gc_thresholds(self):
+        """
+        Scale the gen-0 threshold with the size of the live set.
+
+        With a large permanent archive resident, the default threshold
+        makes every short-lived allocation burst pay for a scan of the
+        whole heap. sqrt(live) collections-per-allocation is the usual
+        compromise; the store's own counts stand in for the live-object
+        total so this never has to materialize gc.get_objects().
+        """
+        live = (len(self.elephants) + len(self.herds)
+                + len(self.events) + len(self.water_sources))
+        gc.set_threshold(max(700, int(math.sqrt(live)) + 11), 10, 10)
+
+    def freeze_bootstrap(self):
+        """
+        Move the loaded archive into the GC's permanent generation.
+
+        Once a dataset is fully loaded it is long-lived by definition,
+        but every gen-2 pass would still rescan all of it. Collecting
+        once (so no garbage gets frozen along for the ride) and then
+        freezing shrinks future sweeps to post-load allocations only.
+        clear() / clear_and_cleanup() unfreeze first — otherwise the
+        dropped objects would sit uncollectable in the permanent
+        generation.
+        """
+        gc.collect()
+        gc.freeze()
     
     def clear(self):
         """Clear all data from memory (for demo - keeps circular references intact)."""
+        # Thaw anything frozen by freeze_bootstrap() so the dropped
+        # objects are visible to the collector again
+        gc.unfreeze()
         # Just remove from store, keep circular references for demo
+        self._mark_dirty()
         self.elephants.clear()
         self.herds.clear()
         self.events.clear()
         self.water_sources.clear()
         self._elephant_by_name.clear()
-        
-        # Also clear class-level storage in WaterSource and Event
-        WaterSource._all_sources.clear()
-        Event._all_events.clear()
-    
+
+        # Also clear class-level storage in WaterSource
+        WaterSource.clear_all()
+
     def clear_and_cleanup(self):
         """Clear all data and break circular references for full cleanup."""
-        # Break circular references before clearing
-        for elephant in self.elephants:
-            elephant._parent = None
-            elephant.children.clear()
-            elephant.herd = None
-        
+        gc.unfreeze()
+        self._mark_dirty()
+        # Break circular references and return instances to the free
+        # list; clear_and_cleanup's contract is that nothing else holds
+        # references to the stored objects
+        Elephant.recycle(self.elephants)
+
         for herd in self.herds:
-            herd.members.clear() if hasattr(herd, 'members') else None
+            if hasattr(herd, 'members'):
+                herd.members.clear()
+                herd._member_ids.clear()
         
         self.elephants.clear()
         self.herds.clear()
         self.events.clear()
         self.water_sources.clear()
         self._elephant_by_name.clear()
-        
-        # Also clear class-level storage in WaterSource and Event
-        WaterSource._all_sources.clear()
-        Event._all_events.clear()
-        
+
+        # Also clear class-level storage in WaterSource
+        WaterSource.clear_all()
+
         # Reset elephant tracking to clear stale IDs
         Elephant.reset_tracking()
     
+    def bulk_load(
+        self,
+        elephants: List[Elephant],
+        herds: List[Herd],
+        events: List[Event],
+        water_sources: List[WaterSource]
+    ):
+        """
+        Load a freshly generated dataset in one shot.
+
+        Takes ownership of the lists and rebuilds the name index with a
+        single dict comprehension instead of per-object appends, avoiding
+        four separate O(N) Python loops on the generation hot path.
+        """
+        self._mark_dirty()
+        self.elephants = list(elephants)
+        self.herds = list(herds)
+        self.events = list(events)
+        self.water_sources = list(water_sources)
+        self._elephant_by_name = {e.name: e for e in self.elephants}
+
+        # Resync the class-level registry with the loaded data. A
+        # cached dataset is reloaded without running __init__ (which
+        # normally registers each source), and clear() empties it.
+        WaterSource._all_sources[:] = self.water_sources
+        WaterSource.invalidate_coords()
+        self._retune_gc_thresholds()
+
     def add_elephant(self, elephant: Elephant):
         """Add elephant to store."""
+        self._mark_dirty()
         self.elephants.append(elephant)
         self._elephant_by_name[elephant.name] = elephant
     
     def add_elephants(self, elephants: List[Elephant]):
         """Add multiple elephants."""
-        for elephant in elephants:
-            self.add_elephant(elephant)
-    
+        self._mark_dirty()
+        with self._gc_paused():
+            self.elephants.extend(elephants)
+            self._elephant_by_name.update((e.name, e) for e in elephants)
+        self._retune_gc_thresholds()
+
     def add_herd(self, herd: Herd):
         """Add herd to store."""
+        self._mark_dirty()
         self.herds.append(herd)
-    
+
     def add_herds(self, herds: List[Herd]):
         """Add multiple herds."""
-        self.herds.extend(herds)
+        self._mark_dirty()
+        with self._gc_paused():
+            self.herds.extend(herds)
+        self._retune_gc_thresholds()
     
     def add_event(self, event: Event):
         """Add event to store."""
+        self._mark_dirty()
         self.events.append(event)
     
     def add_events(self, events: List[Event]):
         """Add multiple events."""
-        self.events.extend(events)
+        self._mark_dirty()
+        with self._gc_paused():
+            self.events.extend(events)
+        self._retune_gc_thresholds()
     
     def add_water_source(self, source: WaterSource):
         """Add water source to store."""
+        self._mark_dirty()
         self.water_sources.append(source)
     
     def add_water_sources(self, sources: List[WaterSource]):
         """Add multiple water sources."""
-        self.water_sources.extend(sources)
+        self._mark_dirty()
+        with self._gc_paused():
+            self.water_sources.extend(sources)
+        self._retune_gc_thresholds()
     
     def get_elephant_by_name(self, name: str) -> Optional[Elephant]:
         """Find elephant by name."""
         return self._elephant_by_name.get(name)
+
+    def _event_indexes(self):
+        """Rebuild the event bucket indexes if the store changed."""
+        if self._event_index_version != self._version:
+            by_year = defaultdict(list)
+            by_type = defaultdict(list)
+            by_elephant = defaultdict(list)
+            for event in self.events:
+                by_year[event.year].append(event)
+                by_type[event.event_type].append(event)
+                for elephant in event.involved_elephants:
+                    by_elephant[id(elephant)].append(event)
+            self._events_by_year = by_year
+            self._events_by_type = by_type
+            self._events_by_elephant = by_elephant
+            self._event_index_version = self._version
+        return (self._events_by_year, self._events_by_type,
+                self._events_by_elephant)
+
+    def search_events_by_year(self, year: int) -> List[Event]:
+        """Find all events in a specific year."""
+        return list(self._event_indexes()[0].get(year, ()))
+
+    def search_events_by_type(self, event_type) -> List[Event]:
+        """Find all events of a specific type."""
+        return list(self._event_indexes()[1].get(event_type, ()))
+
+    def search_events_by_elephant(self, elephant: Elephant) -> List[Event]:
+        """Find all events involving a specific elephant."""
+        return list(self._event_indexes()[2].get(id(elephant), ()))
+
+    def search_events_by_location(self, location: str) -> List[Event]:
+        """Find all events at a location (substring match)."""
+        needle = location.lower()
+        return [e for e in self.events if needle in e._location_lower]
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get statistics about stored data."""
-        total_relationships = sum(
-            len(e.children) + (1 if e.parent else 0) 
-            for e in self.elephants
-        )
-        
-        return {
+        """Get statistics about stored data (cached until the store mutates)."""
+        if self._stats_cache_version == self._version:
+            return self._stats_cache
+
+        # Vectorized reductions over the columnar views instead of
+        # pointer-chasing every elephant object. Every child link is
+        # mirrored by exactly one parent back-pointer, so the
+        # relationship total is twice the child-count sum.
+        child_total = int(self.child_counts_np.sum())
+
+        self._stats_cache = {
             "total_elephants": len(self.elephants),
             "total_herds": len(self.herds),
             "total_events": len(self.events),
             "total_water_sources": len(self.water_sources),
-            "circular_references": total_relationships,
-            "avg_children": sum(len(e.children) for e in self.elephants) / max(len(self.elephants), 1)
+            "circular_references": child_total * 2,
+            "avg_children": child_total / max(len(self.elephants), 1)
         }
+        self._stats_cache_version = self._version
+        return self._stats_cache
     
     def export_to_json(self, filepath: str):
         """
@@ -130,59 +328,74 @@ class MemoryStore:
         """
         if not filepath:
             raise ValueError("Filepath cannot be empty")
-        
-        data = {
-            "elephants": [
-                {
+
+        def _elephant_records():
+            for e in self.elephants:
+                yield {
                     "name": e.name,
                     "birth_year": e.birth_year,
                     "gender": e.gender,
                     "children": [c.name for c in e.children]
                 }
-                for e in self.elephants
-            ],
-            "herds": [
-                {
+
+        def _herd_records():
+            for h in self.herds:
+                yield {
                     "name": h.name,
                     "territory": h.territory,
                     "members": [m.name for m in h.members]
                 }
-                for h in self.herds
-            ],
-            "events": [
-                {
-                    "type": e.event_type.value,
+
+        def _event_records():
+            for e in self.events:
+                yield {
+                    "type": e.event_type.label,
                     "year": e.year,
                     "location": e.location,
                     "description": e.description
                 }
-                for e in self.events
-            ]
-        }
-        
+
         try:
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Stream one record at a time with orjson instead of building
+            # a single giant dict and serializing it with stdlib json —
+            # keeps peak allocation O(record) instead of O(archive).
+            with open(filepath, 'wb') as f:
+                f.write(b'{')
+                for i, (key, records) in enumerate([
+                    (b'"elephants"', _elephant_records()),
+                    (b'"herds"', _herd_records()),
+                    (b'"events"', _event_records())
+                ]):
+                    if i:
+                        f.write(b',')
+                    f.write(key + b':[')
+                    for j, record in enumerate(records):
+                        if j:
+                            f.write(b',')
+                        f.write(orjson.dumps(record))
+                    f.write(b']')
+                f.write(b'}')
         except (IOError, OSError) as e:
             raise IOError(f"Failed to write to {filepath}: {str(e)}")
     
     def get_circular_reference_count(self) -> int:
         """
-        Count total circular references in memory.
+        Count total circular references in memory (cached per version).
         Each parent-child relationship creates a cycle (bidirectional).
         Each herd membership creates an elephant↔herd reference.
         """
-        count = 0
-        for elephant in self.elephants:
-            # Each child relationship is bidirectional: parent→child and child→parent
-            # We count each unique relationship once (already counted via children list)
-            count += len(elephant.children)
-            # Each elephant with a herd creates one elephant→herd reference
-            # (herd→elephant is already counted in herd.members)
-            if elephant.herd is not None:
-                count += 1
-        return count
+        if self._circular_count_version != self._version:
+            # Each child relationship is bidirectional and counted once
+            # via the children list; each herd membership mirrors one
+            # elephant→herd reference, so summing herd rosters covers
+            # them without touching every elephant's herd attribute
+            self._circular_count = (
+                sum(len(e.children) for e in self.elephants)
+                + sum(len(h.members) for h in self.herds)
+            )
+            self._circular_count_version = self._version
+        return self._circular_count
 
 
 # Global singleton instance
@@ -3,12 +3,23 @@ Elephant model with circular references for family relationships.
 This demonstrates Python's cyclic garbage collection.
 """
 
-from typing import Optional, List, Set, TYPE_CHECKING
+import sys
+import weakref
+from collections import deque
+from typing import Optional, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from models.herd import Herd
 
 
+def _decrement_live_count():
+    """Finalizer for Elephant instances (see Elephant.__new__)."""
+    # Guard against going negative if reset_tracking() already zeroed
+    # the counter before old instances were collected.
+    if Elephant._live_count > 0:
+        Elephant._live_count -= 1
+
+
 class Elephant:
     """
     Represents an elephant with family relationships.
@@ -17,10 +28,59 @@ class Elephant:
     - parent/children create bidirectional references
     - Python's cyclic GC handles cleanup automatically
     """
-    
-    _instances: Set[int] = set()
+
+    # No per-instance __dict__: with 10k+ elephants the dict overhead
+    # dominates memory. __weakref__ keeps weak references working.
+    __slots__ = ('name', 'birth_year', 'gender', '_parent', 'children',
+                 'herd', '_id', '__weakref__')
+
+    # Feature flag: store the child→parent back-pointer as a weakref.
+    # With it on, plain reference counting frees a family the moment
+    # the store drops it — no cyclic-GC pass needed. Off by default
+    # because this demo exists to showcase exactly those cycles.
+    use_weak_refs = False
+
+    _live_count = 0
     _instance_count = 0
-    
+
+    # Free list: repeated generate/clear cycles are this demo's main
+    # usage pattern, and recycling instances avoids obmalloc arena
+    # churn that CPython may never hand back to the OS
+    _pool: List['Elephant'] = []
+    _POOL_CAP = 10_000
+
+    def __new__(cls, *args, **kwargs):
+        if cls._pool:
+            # Recycled instances already carry their finalizer
+            return cls._pool.pop()
+        self = super().__new__(cls)
+        # weakref.finalize instead of __del__: it runs outside the GC's
+        # finalization phase, so cyclic families are collected without
+        # the finalizer slow path, and it fires exactly once per
+        # physical instance no matter how often the pool re-inits it
+        weakref.finalize(self, _decrement_live_count)
+        return self
+
+    @classmethod
+    def recycle(cls, elephants: List['Elephant']):
+        """
+        Break relationships and return instances to the free list.
+
+        Callers must guarantee no live references to these instances
+        remain — a recycled elephant is re-initialized on next
+        construction. The pool is capped; overflow instances just get
+        their references broken and are left for the GC.
+        """
+        for elephant in elephants:
+            elephant._parent = None
+            elephant.children.clear()
+            elephant.herd = None
+            if len(cls._pool) < cls._POOL_CAP:
+                cls._pool.append(elephant)
+                # Pooled instances no longer count as living
+                if cls._live_count > 0:
+                    cls._live_count -= 1
+
     def __init__(self, name: str, birth_year: int, gender: str):
         """
         Args:
@@ -28,7 +88,10 @@ class Elephant:
             birth_year: Year of birth
             gender: 'M' or 'F'
         """
-        self.name = name
+        # Interned: names are reused as dict keys all over the search
+        # and genealogy indexes, so sharing one str object per name
+        # saves memory and lets lookups short-circuit on identity
+        self.name = sys.intern(name)
         self.birth_year = birth_year
         self.gender = gender
         self._parent: Optional['Elephant'] = None
@@ -36,26 +99,34 @@ class Elephant:
         self.herd: Optional['Herd'] = None
         
         Elephant._instance_count += 1
-        Elephant._instances.add(id(self))
+        Elephant._live_count += 1
         self._id = Elephant._instance_count
     
     @property
     def parent(self) -> Optional['Elephant']:
-        """Get parent elephant."""
+        """Get parent elephant (dereferencing the weak back-pointer if enabled)."""
+        if isinstance(self._parent, weakref.ref):
+            return self._parent()
         return self._parent
-    
+
     @parent.setter
     def parent(self, value: Optional['Elephant']):
-        """Set parent, creating circular reference."""
-        self._parent = value
-        if value is not None and self not in value.children:
+        """Set parent, creating circular reference (or a weak back-pointer)."""
+        # Single-parent invariant: self sits in value.children iff value
+        # was already the parent, so an identity check replaces the
+        # O(len(children)) membership scan
+        prev = self.parent
+        if value is not None and Elephant.use_weak_refs:
+            self._parent = weakref.ref(value)
+        else:
+            self._parent = value
+        if value is not None and prev is not value:
             value.children.append(self)
-    
+
     def add_child(self, child: 'Elephant'):
         """Add a child, creating bidirectional relationship."""
-        if child not in self.children:
-            self.children.append(child)
-            child.parent = self
+        if child.parent is not self:
+            child.parent = self  # Setter appends to our children list
     
     def get_siblings(self) -> List['Elephant']:
         """Get all siblings (same parent)."""
@@ -64,33 +135,31 @@ class Elephant:
         return [child for child in self.parent.children if child != self]
     
     def get_descendants(self, max_depth: int = 10) -> List['Elephant']:
-        """Recursively get all descendants up to max_depth generations.
-        
+        """Get all descendants up to max_depth generations.
+
+        Iterative BFS: one frame regardless of tree depth, and the
+        visited set guards against malformed cyclic ancestry.
+
         Args:
-            max_depth: Maximum depth to traverse (prevents runaway recursion)
-            
+            max_depth: Maximum depth to traverse (prevents runaway traversal)
+
         Returns:
             List of all descendant elephants
         """
         descendants = []
-        visited = set()
-        
-        def _traverse(elephant: 'Elephant', depth: int):
+        visited = {id(self)}
+        queue = deque([(self, 0)])
+        while queue:
+            elephant, depth = queue.popleft()
             if depth >= max_depth:
-                return
-            
-            elephant_id = id(elephant)
-            if elephant_id in visited:
-                return
-            visited.add(elephant_id)
-            
+                continue
             for child in elephant.children:
-                # Add child before traversing to ensure it's in the list
-                if id(child) not in visited:
-                    descendants.append(child)
-                _traverse(child, depth + 1)
-        
-        _traverse(self, 0)
+                child_id = id(child)
+                if child_id in visited:
+                    continue
+                visited.add(child_id)
+                descendants.append(child)
+                queue.append((child, depth + 1))
         return descendants
     
     def age_in_year(self, year: int) -> int:
@@ -102,17 +171,13 @@ class Elephant:
         return (f"Elephant(name='{self.name}', birth={self.birth_year}, "
                 f"parent={parent_name}, children={len(self.children)})")
     
-    def __del__(self):
-        """Track when instances are garbage collected."""
-        Elephant._instances.discard(id(self))
-    
     @classmethod
     def get_instance_count(cls) -> int:
-        """Get number of living instances."""
-        return len(cls._instances)
-    
+        """Get number of living instances (O(1) counter read)."""
+        return cls._live_count
+
     @classmethod
     def reset_tracking(cls):
         """Reset tracking."""
-        cls._instances.clear()
+        cls._live_count = 0
         cls._instance_count = 0
@@ -2,23 +2,45 @@
 Event model for tracking significant occurrences.
 """
 
+import sys
 from typing import List, Optional, TYPE_CHECKING
 from datetime import date
-from enum import Enum
+from enum import IntEnum
 
 if TYPE_CHECKING:
     from models.elephant import Elephant
     from models.herd import Herd
 
 
-class EventType(Enum):
-    """Types of events in elephant history."""
-    BIRTH = "birth"
-    MIGRATION = "migration"
-    WATER_DISCOVERY = "water_discovery"
-    DROUGHT = "drought"
-    GATHERING = "gathering"
-    DANGER = "danger"
+class EventType(IntEnum):
+    """
+    Types of events in elephant history.
+
+    Stored as small integers so comparisons, grouping, and columnar
+    indexing are integer ops; display names live in EVENT_TYPE_NAMES.
+    """
+    BIRTH = 0
+    MIGRATION = 1
+    WATER_DISCOVERY = 2
+    DROUGHT = 3
+    GATHERING = 4
+    DANGER = 5
+
+    @property
+    def label(self) -> str:
+        """Human-readable name for UI rendering and export."""
+        return EVENT_TYPE_NAMES[self]
+
+
+# Display names indexed by EventType code
+EVENT_TYPE_NAMES = (
+    "birth",
+    "migration",
+    "water_discovery",
+    "drought",
+    "gathering",
+    "danger",
+)
 
 
 class Event:
@@ -28,8 +50,10 @@ class Event:
     Links elephants, herds, and locations together.
     Potential for complex circular references.
     """
-    
-    _all_events: List['Event'] = []
+
+    __slots__ = ('event_type', 'year', 'location', 'description',
+                 'involved_elephants', 'involved_herds', 'timestamp',
+                 '_location_lower', '_loc_key')
     
     def __init__(
         self,
@@ -51,45 +75,21 @@ class Event:
         """
         self.event_type = event_type
         self.year = year
-        self.location = location
+        # Interned: rounded coordinates repeat heavily across large
+        # event batches, so duplicates share one str object
+        self.location = sys.intern(location)
         self.description = description
         self.involved_elephants = involved_elephants or []
         self.involved_herds = involved_herds or []
         self.timestamp = date.today()
-        
-        # Index this event
-        Event._all_events.append(self)
-    
-    @classmethod
-    def search_by_year(cls, year: int) -> List['Event']:
-        """Find all events in a specific year."""
-        return [e for e in cls._all_events if e.year == year]
-    
-    @classmethod
-    def search_by_location(cls, location: str) -> List['Event']:
-        """Find all events at a location."""
-        return [e for e in cls._all_events if location.lower() in e.location.lower()]
-    
-    @classmethod
-    def search_by_elephant(cls, elephant: 'Elephant') -> List['Event']:
-        """Find all events involving a specific elephant."""
-        return [e for e in cls._all_events if elephant in e.involved_elephants]
-    
-    @classmethod
-    def search_by_type(cls, event_type: EventType) -> List['Event']:
-        """Find all events of a specific type."""
-        return [e for e in cls._all_events if e.event_type == event_type]
-    
-    @classmethod
-    def get_all_events(cls) -> List['Event']:
-        """Get all recorded events."""
-        return cls._all_events.copy()
-    
-    @classmethod
-    def clear_all(cls):
-        """Clear all events (for testing)."""
-        cls._all_events.clear()
-    
+        self._location_lower = sys.intern(location.lower())
+        # 1-degree grid cell, parsed once instead of on every reindex
+        try:
+            lat, lon = map(float, location.split(','))
+            self._loc_key = (int(lat), int(lon))
+        except ValueError:
+            self._loc_key = (None, None)
+
     def __repr__(self) -> str:
-        return (f"Event({self.event_type.value}, {self.year}, "
+        return (f"Event({self.event_type.label}, {self.year}, "
                 f"'{self.location}', elephants={len(self.involved_elephants)})")
@@ -5,6 +5,7 @@ Also creates circular references: Herd ↔ Elephants
 
 from typing import List, Optional, TYPE_CHECKING
 from datetime import date
+from operator import attrgetter
 
 if TYPE_CHECKING:
     from models.elephant import Elephant
@@ -18,9 +19,12 @@ class Herd:
     - Herd contains elephants
     - Each elephant has a reference back to herd
     """
-    
+
+    __slots__ = ('name', 'territory', 'members', '_member_ids',
+                 'established_year', '_id')
+
     _instance_count = 0
-    
+
     def __init__(self, name: str, territory: str):
         """
         Args:
@@ -30,23 +34,30 @@ class Herd:
         self.name = name
         self.territory = territory
         self.members: List['Elephant'] = []
+        # Identity set mirroring members, so membership checks are O(1)
+        # instead of scanning the roster on every add/remove
+        self._member_ids = set()
         self.established_year: int = date.today().year
-        
+
         Herd._instance_count += 1
         self._id = Herd._instance_count
-    
+
     def add_member(self, elephant: 'Elephant'):
         """
         Add an elephant to the herd.
         Creates circular reference: herd.members → elephant.herd → herd
         """
-        if elephant not in self.members:
+        eid = id(elephant)
+        if eid not in self._member_ids:
+            self._member_ids.add(eid)
             self.members.append(elephant)
             elephant.herd = self  # CIRCULAR REFERENCE
-    
+
     def remove_member(self, elephant: 'Elephant'):
         """Remove an elephant from the herd."""
-        if elephant in self.members:
+        eid = id(elephant)
+        if eid in self._member_ids:
+            self._member_ids.discard(eid)
             self.members.remove(elephant)
             elephant.herd = None
     
@@ -58,20 +69,45 @@ class Herd:
         Returns:
             The oldest female elephant, or None if no females exist.
         """
-        females = [e for e in self.members if e.gender == 'F']
-        if not females:
-            return None
-        return min(females, key=lambda e: e.birth_year)
+        # Fused filter+min over a generator: one pass, no intermediate
+        # females list, C-level attrgetter for the key
+        return min(
+            (e for e in self.members if e.gender == 'F'),
+            key=attrgetter('birth_year'),
+            default=None
+        )
     
     def get_family_count(self) -> int:
         """Count distinct family groups in the herd."""
+        # Fast path for the common single-matriarch herd: if every
+        # member's parent is in the herd (or absent) and exactly one
+        # member is parentless, all ancestry chains end at that one
+        # root — no traversal needed
+        parentless = 0
+        closed = True
+        for elephant in self.members:
+            if elephant.parent is None:
+                parentless += 1
+            elif id(elephant.parent) not in self._member_ids:
+                closed = False
+                break
+        if closed and parentless == 1:
+            return 1
+        # Memoized walk with path compression: siblings share ancestry,
+        # so each chain is climbed once instead of once per member —
+        # amortized O(members) instead of O(members × depth)
+        root_cache = {}
         families = set()
         for elephant in self.members:
-            # Trace back to root ancestor
-            root = elephant
-            while root.parent is not None:
-                root = root.parent
-            families.add(id(root))
+            path = []
+            node = elephant
+            while id(node) not in root_cache and node.parent is not None:
+                path.append(node)
+                node = node.parent
+            root_id = root_cache.get(id(node), id(node))
+            for visited in path:
+                root_cache[id(visited)] = root_id
+            families.add(root_id)
         return len(families)
     
     def __repr__(self) -> str:
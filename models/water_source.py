@@ -2,7 +2,14 @@
 Water source model with historical data tracking.
 """
 
-from typing import Dict, List, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy is optional; fall back to the linear scan
+    cKDTree = None
 
 if TYPE_CHECKING:
     from models.elephant import Elephant
@@ -12,9 +19,18 @@ class WaterSource:
     """
     Represents a water source with historical availability data.
     """
-    
+
+    __slots__ = ('name', 'latitude', 'longitude', 'capacity',
+                 '_base_year', '_avail', 'visit_history')
+
     _all_sources: List['WaterSource'] = []
-    
+    # Columnar (SoA) coordinate cache over _all_sources, rebuilt lazily
+    # so find_nearest is a vectorized argmin instead of a Python min
+    _lat_arr: Optional[np.ndarray] = None
+    _lon_arr: Optional[np.ndarray] = None
+    _kdtree = None
+    _coords_dirty = True
+
     def __init__(
         self,
         name: str,
@@ -34,32 +50,68 @@ class WaterSource:
         self.longitude = longitude
         self.capacity = capacity
         
-        # Historical data: year -> availability (True/False)
-        self.availability_history: Dict[int, bool] = {}
-        
-        # Visits: year -> list of elephants that visited
-        self.visit_history: Dict[int, List['Elephant']] = {}
-        
+        # Availability as a dense boolean column anchored at _base_year:
+        # one byte per year instead of a dict entry plus a boxed bool,
+        # and drought queries become array slices
+        self._base_year: Optional[int] = None
+        self._avail = np.ones(0, dtype=np.bool_)
+
+        # Visits: year -> {id(elephant): elephant}, id-keyed so the
+        # dedup check on insert is a hash probe instead of a list scan
+        self.visit_history: Dict[int, Dict[int, 'Elephant']] = {}
+
+
         WaterSource._all_sources.append(self)
-    
+        WaterSource._coords_dirty = True
+
     def record_availability(self, year: int, available: bool):
         """Record whether water was available in a given year."""
-        self.availability_history[year] = available
+        if self._base_year is None:
+            self._base_year = year
+            self._avail = np.ones(1, dtype=np.bool_)
+        elif year < self._base_year:
+            # Grow the column backwards; unrecorded years default True
+            pad = np.ones(self._base_year - year, dtype=np.bool_)
+            self._avail = np.concatenate((pad, self._avail))
+            self._base_year = year
+        elif year >= self._base_year + self._avail.size:
+            pad = np.ones(
+                year - self._base_year - self._avail.size + 1, dtype=np.bool_
+            )
+            self._avail = np.concatenate((self._avail, pad))
+        self._avail[year - self._base_year] = available
     
     def record_visit(self, year: int, elephant: 'Elephant'):
-        """Record an elephant visit."""
-        if year not in self.visit_history:
-            self.visit_history[year] = []
-        if elephant not in self.visit_history[year]:
-            self.visit_history[year].append(elephant)
+        """Record an elephant visit (O(1) dedup)."""
+        self.visit_history.setdefault(year, {})[id(elephant)] = elephant
+
+    def get_visitors(self, year: int) -> List['Elephant']:
+        """Elephants that visited in a given year, in visit order."""
+        return list(self.visit_history.get(year, {}).values())
     
     def was_available(self, year: int) -> bool:
         """Check if water was available in a given year."""
-        return self.availability_history.get(year, True)
-    
+        if self._base_year is None:
+            return True
+        idx = year - self._base_year
+        if idx < 0 or idx >= self._avail.size:
+            return True
+        return bool(self._avail[idx])
+
     def get_drought_years(self) -> List[int]:
-        """Get years when this source was dry."""
-        return [year for year, avail in self.availability_history.items() if not avail]
+        """Get years when this source was dry (sorted)."""
+        if self._base_year is None:
+            return []
+        return (np.nonzero(~self._avail)[0] + self._base_year).tolist()
+
+    def get_droughts_in_range(self, start_year: int, end_year: int) -> List[int]:
+        """Drought years within [start_year, end_year] via a bitmap slice."""
+        if self._base_year is None:
+            return []
+        lo = max(start_year - self._base_year, 0)
+        hi = max(end_year - self._base_year + 1, 0)
+        window = self._avail[lo:hi]
+        return (np.nonzero(~window)[0] + self._base_year + lo).tolist()
     
     def distance_to(self, lat: float, lon: float) -> float:
         """
@@ -68,31 +120,78 @@ class WaterSource:
         """
         return ((self.latitude - lat) ** 2 + (self.longitude - lon) ** 2) ** 0.5
     
+    @classmethod
+    def _coord_columns(cls):
+        """Rebuild the coordinate columns if the registry changed."""
+        if cls._coords_dirty:
+            n = len(cls._all_sources)
+            cls._lat_arr = np.fromiter(
+                (s.latitude for s in cls._all_sources), np.float64, count=n
+            )
+            cls._lon_arr = np.fromiter(
+                (s.longitude for s in cls._all_sources), np.float64, count=n
+            )
+            cls._kdtree = (
+                cKDTree(np.column_stack((cls._lat_arr, cls._lon_arr)))
+                if cKDTree and n else None
+            )
+            cls._coords_dirty = False
+        return cls._lat_arr, cls._lon_arr
+
+    @classmethod
+    def invalidate_coords(cls):
+        """Flag the coordinate columns for rebuild (after a bulk resync)."""
+        cls._coords_dirty = True
+
     @classmethod
     def find_nearest(cls, lat: float, lon: float, year: int = None) -> 'WaterSource':
         """
         Find nearest water source to coordinates.
         Optionally filter by availability in a specific year.
         """
-        sources = cls._all_sources
-        
-        if year is not None:
-            sources = [s for s in sources if s.was_available(year)]
-        
-        if not sources:
+        if not cls._all_sources:
             return None
-        
-        return min(sources, key=lambda s: s.distance_to(lat, lon))
-    
+
+        lats, lons = cls._coord_columns()
+
+        if cls._kdtree is not None:
+            if year is None:
+                # O(log N) tree query beats the broadcast for large sets
+                _, idx = cls._kdtree.query((lat, lon))
+                return cls._all_sources[int(idx)]
+            # Filtered query: check the few nearest neighbours first;
+            # fall through to the masked scan only if all are dry
+            k = min(8, len(cls._all_sources))
+            _, idxs = cls._kdtree.query((lat, lon), k=k)
+            for i in np.atleast_1d(idxs):
+                source = cls._all_sources[int(i)]
+                if source.was_available(year):
+                    return source
+
+        # Squared distances over the coordinate columns in one C pass;
+        # unavailable sources are masked out with inf
+        dist_sq = (lats - lat) ** 2 + (lons - lon) ** 2
+        if year is not None:
+            available = np.fromiter(
+                (s.was_available(year) for s in cls._all_sources),
+                bool, count=dist_sq.size
+            )
+            if not available.any():
+                return None
+            dist_sq = np.where(available, dist_sq, np.inf)
+        return cls._all_sources[int(dist_sq.argmin())]
+
     @classmethod
     def get_all_sources(cls) -> List['WaterSource']:
         """Get all water sources."""
         return cls._all_sources.copy()
-    
+
     @classmethod
     def clear_all(cls):
         """Clear all sources (for testing)."""
         cls._all_sources.clear()
+        cls._kdtree = None
+        cls._coords_dirty = True
     
     def __repr__(self) -> str:
         return (f"WaterSource(name='{self.name}', "
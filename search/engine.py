@@ -5,6 +5,14 @@ Operates on in-memory objects with dictionary-based indexes.
 
 from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
+from operator import attrgetter
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy is optional; fall back to the linear scan
+    cKDTree = None
+
 from models.elephant import Elephant
 from models.event import Event, EventType
 from models.water_source import WaterSource
@@ -19,10 +27,10 @@ class ElephantSearchEngine:
     
     def __init__(self):
         # Event indexes
-        self._year_index: Dict[int, List[Event]] = defaultdict(list)
-        self._location_index: Dict[str, List[Event]] = defaultdict(list)
+        self._location_index: Dict[Tuple[Optional[int], Optional[int]], List[Event]] = defaultdict(list)
         self._elephant_index: Dict[str, List[Event]] = defaultdict(list)
         self._event_type_index: Dict[EventType, List[Event]] = defaultdict(list)
+        self._migrations_by_year: Dict[int, List[Event]] = defaultdict(list)
         
         # Elephant indexes
         self._elephant_by_name: Dict[str, Elephant] = {}
@@ -30,7 +38,33 @@ class ElephantSearchEngine:
         
         # Herd indexes
         self._herd_by_name: Dict[str, Herd] = {}
-        
+
+        # Columnar (SoA) event data for vectorized aggregations
+        self._events: List[Event] = []
+        self._event_years: np.ndarray = np.empty(0, dtype=np.int32)
+        self._event_type_codes: np.ndarray = np.empty(0, dtype=np.int8)
+
+        # Year index: sort once, binary-search many. Replaces the old
+        # dict[int, list[Event]] whose per-year lists dominated index_all
+        self._year_order: np.ndarray = np.empty(0, dtype=np.int64)
+        self._sorted_years: np.ndarray = np.empty(0, dtype=np.int32)
+
+        # Drought inverted index: (year, source name) pairs sorted by year,
+        # so range queries are two binary searches instead of an O(S·Y) scan
+        self._drought_years: np.ndarray = np.empty(0, dtype=np.int32)
+        self._drought_source_names: List[str] = []
+
+        # Water-source spatial index: SoA coordinate columns, a KD-tree
+        # when scipy is available, and per-year availability masks
+        self._water_sources: List[WaterSource] = []
+        self._ws_coords: np.ndarray = np.empty((0, 2), dtype=np.float64)
+        self._ws_tree = None
+        self._ws_avail_cache: Dict[int, np.ndarray] = {}
+
+        # Precomputed milestone alerts for the demo's fixed current year
+        self._alerts_year = 2026
+        self._migration_alerts: Optional[List[Tuple[str, int]]] = None
+
         self._indexed = False
     
     def index_all(
@@ -50,10 +84,10 @@ class ElephantSearchEngine:
         self._indexed = False
         
         # Clear existing indexes
-        self._year_index.clear()
         self._location_index.clear()
         self._elephant_index.clear()
         self._event_type_index.clear()
+        self._migrations_by_year.clear()
         self._elephant_by_name.clear()
         self._elephants_by_year.clear()
         self._herd_by_name.clear()
@@ -69,32 +103,73 @@ class ElephantSearchEngine:
         
         # Index events
         for event in events:
-            # Year index
-            self._year_index[event.year].append(event)
-            
-            # Location index (group by region)
-            location_key = self._get_location_key(event.location)
-            self._location_index[location_key].append(event)
+            # Location index (grid cell precomputed at construction)
+            self._location_index[event._loc_key].append(event)
             
             # Event type index
             self._event_type_index[event.event_type].append(event)
+            if event.event_type == EventType.MIGRATION:
+                self._migrations_by_year[event.year].append(event)
             
             # Elephant index (each elephant mentioned in event)
             for elephant in event.involved_elephants:
                 self._elephant_index[elephant.name].append(event)
-        
+
+        # Columnar arrays: one C-level reduction replaces per-event
+        # attribute chasing in the UI (e.g. event-type histograms)
+        type_codes = {event_type: code for code, event_type in enumerate(EventType)}
+        self._events = list(events)
+        self._event_years = np.fromiter(
+            (e.year for e in events), dtype=np.int32, count=len(events)
+        )
+        self._event_type_codes = np.fromiter(
+            (type_codes[e.event_type] for e in events), dtype=np.int8, count=len(events)
+        )
+
+        # Year lookups are two binary searches on this sorted view
+        self._year_order = np.argsort(self._event_years, kind='stable')
+        self._sorted_years = self._event_years[self._year_order]
+
+        self._index_droughts(WaterSource.get_all_sources())
+        self._index_water_sources(WaterSource.get_all_sources())
+
+        # Alerts depend only on the events and the (fixed) current year
+        self._migration_alerts = self._compute_migration_alerts(self._alerts_year)
+
         self._indexed = True
-    
-    @staticmethod
-    def _get_location_key(location: str) -> str:
-        """Convert location string to region key for indexing."""
-        try:
-            # Location format: "lat, lon"
-            lat, lon = map(float, location.split(','))
-            # Group into 1-degree grid cells
-            return f"{int(lat)},{int(lon)}"
-        except:
-            return "unknown"
+
+    def _index_water_sources(self, sources: List[WaterSource]):
+        """Build the spatial index over water-source coordinates."""
+        self._water_sources = list(sources)
+        self._ws_coords = np.array(
+            [[s.latitude, s.longitude] for s in sources], dtype=np.float64
+        ).reshape(len(sources), 2)
+        self._ws_tree = cKDTree(self._ws_coords) if cKDTree and sources else None
+        self._ws_avail_cache.clear()
+
+    def _availability_mask(self, year: int) -> np.ndarray:
+        """Boolean per-source availability column for one year (memoized)."""
+        mask = self._ws_avail_cache.get(year)
+        if mask is None:
+            mask = np.fromiter(
+                (s.was_available(year) for s in self._water_sources),
+                dtype=bool,
+                count=len(self._water_sources)
+            )
+            self._ws_avail_cache[year] = mask
+        return mask
+
+    def _index_droughts(self, sources: List[WaterSource]):
+        """Build the sorted (year, source) drought index."""
+        pairs = sorted(
+            (year, source.name)
+            for source in sources
+            for year in source.get_drought_years()
+        )
+        self._drought_years = np.fromiter(
+            (year for year, _ in pairs), dtype=np.int32, count=len(pairs)
+        )
+        self._drought_source_names = [name for _, name in pairs]
     
     def find_nearest_water(
         self, 
@@ -113,7 +188,26 @@ class ElephantSearchEngine:
         Returns:
             Nearest WaterSource or None
         """
-        return WaterSource.find_nearest(lat, lon, year)
+        if not self._water_sources:
+            return WaterSource.find_nearest(lat, lon, year)
+
+        if year is None and self._ws_tree is not None:
+            # Unfiltered nearest neighbour: O(log N) tree query
+            _, idx = self._ws_tree.query([lat, lon])
+            return self._water_sources[int(idx)]
+
+        # Year-filtered (or scipy-less) path: one vectorized hypot over
+        # the SoA coordinate columns, with unavailable sources pushed to
+        # +inf before the argmin — no per-source Python attribute access
+        distances = np.hypot(
+            self._ws_coords[:, 0] - lat, self._ws_coords[:, 1] - lon
+        )
+        if year is not None:
+            distances = np.where(self._availability_mask(year), distances, np.inf)
+        idx = int(distances.argmin())
+        if not np.isfinite(distances[idx]):
+            return None
+        return self._water_sources[idx]
     
     def search_droughts(self, start_year: int, end_year: int) -> Dict[str, List[int]]:
         """
@@ -126,36 +220,75 @@ class ElephantSearchEngine:
         Returns:
             Dict mapping water source names to list of drought years
         """
+        if self._drought_years.size:
+            # Two C-level bisects bound the matching range; only the
+            # matching (year, source) pairs are touched afterwards
+            lo = int(np.searchsorted(self._drought_years, start_year, side='left'))
+            hi = int(np.searchsorted(self._drought_years, end_year, side='right'))
+            results: Dict[str, List[int]] = {}
+            for year, name in zip(
+                self._drought_years[lo:hi].tolist(),
+                self._drought_source_names[lo:hi]
+            ):
+                results.setdefault(name, []).append(year)
+            return results
+
+        # Fallback: scan sources directly when nothing has been indexed yet
         results = {}
-        
+
         for source in WaterSource.get_all_sources():
-            drought_years = [
-                year for year in range(start_year, end_year + 1)
-                if not source.was_available(year)
-            ]
+            # Sparse per-source drought list sliced with two bisects
+            # instead of probing every year in the range
+            drought_years = source.get_droughts_in_range(start_year, end_year)
             if drought_years:
                 results[source.name] = drought_years
-        
+
         return results
     
+    def _year_slice(self, start_year: int, end_year: int) -> Tuple[int, int]:
+        """Bounds of [start_year, end_year] in the sorted year view."""
+        lo = int(np.searchsorted(self._sorted_years, start_year, side='left'))
+        hi = int(np.searchsorted(self._sorted_years, end_year, side='right'))
+        return lo, hi
+
     def search_by_year(self, year: int) -> List[Event]:
         """
-        Search events by year (O(1) lookup using index).
-        
+        Search events by year (two binary searches on the sorted index).
+
         Args:
             year: Year to search for
-            
+
         Returns:
             List of events in that year
         """
-        return self._year_index.get(year, [])
-    
+        lo, hi = self._year_slice(year, year)
+        return [self._events[i] for i in self._year_order[lo:hi]]
+
+    def get_year_type_counts(self, year: int) -> Dict[str, int]:
+        """
+        Count events per type for a given year using a vectorized bincount.
+
+        Args:
+            year: Year to aggregate
+
+        Returns:
+            Dict mapping event type names to counts (nonzero entries only)
+        """
+        lo, hi = self._year_slice(year, year)
+        counts = np.bincount(
+            self._event_type_codes[self._year_order[lo:hi]],
+            minlength=len(EventType)
+        )
+        return {
+            event_type.label: int(count)
+            for event_type, count in zip(EventType, counts)
+            if count
+        }
+
     def search_by_year_range(self, start_year: int, end_year: int) -> List[Event]:
         """Search events in year range."""
-        events = []
-        for year in range(start_year, end_year + 1):
-            events.extend(self._year_index.get(year, []))
-        return events
+        lo, hi = self._year_slice(start_year, end_year)
+        return [self._events[i] for i in self._year_order[lo:hi]]
     
     def search_by_elephant(self, name: str) -> List[Event]:
         """
@@ -187,12 +320,12 @@ class ElephantSearchEngine:
         """
         events = []
         center_lat, center_lon = int(lat), int(lon)
-        
+
         for dlat in range(-radius, radius + 1):
             for dlon in range(-radius, radius + 1):
-                key = f"{center_lat + dlat},{center_lon + dlon}"
-                events.extend(self._location_index.get(key, []))
-        
+                key = (center_lat + dlat, center_lon + dlon)
+                events.extend(self._location_index.get(key, ()))
+
         return events
     
     def get_elephant_timeline(self, name: str) -> Dict[str, any]:
@@ -210,7 +343,8 @@ class ElephantSearchEngine:
             return {}
         
         events = self.search_by_elephant(name)
-        events_sorted = sorted(events, key=lambda e: e.year)
+        # attrgetter avoids a Python lambda frame per key extraction
+        events_sorted = sorted(events, key=attrgetter('year'))
         
         return {
             "elephant": elephant,
@@ -221,35 +355,43 @@ class ElephantSearchEngine:
             "event_count": len(events_sorted)
         }
     
+    def _compute_migration_alerts(self, current_year: int) -> List[Tuple[str, int]]:
+        """Collect milestone-anniversary migrations from the year buckets."""
+        # Five posting-list lookups instead of a scan over every
+        # migration; iterating milestones in order keeps the result
+        # sorted without a final sort pass
+        alerts = []
+        for years_ago in (5, 10, 15, 20, 25):
+            for event in self._migrations_by_year.get(current_year - years_ago, ()):
+                alerts.append((
+                    f"{years_ago}-year anniversary of {event.description}",
+                    years_ago
+                ))
+        return alerts
+
     def get_migration_alerts(self, current_year: int = 2026) -> List[Tuple[str, int]]:
         """
         Get migration anniversary alerts.
-        
+
+        The default-year result is precomputed in index_all, so repeat
+        calls are an O(1) list return instead of an event scan.
+
         Args:
             current_year: Current year for calculating anniversaries
-            
+
         Returns:
             List of (description, years_ago) tuples
         """
-        alerts = []
-        migration_events = self._event_type_index.get(EventType.MIGRATION, [])
-        
-        for event in migration_events:
-            years_ago = current_year - event.year
-            if years_ago in [5, 10, 15, 20, 25]:  # Milestone anniversaries
-                alerts.append((
-                    f"{years_ago}-year anniversary of {event.description}",
-                    years_ago
-                ))
-        
-        return sorted(alerts, key=lambda x: x[1])
+        if current_year == self._alerts_year and self._migration_alerts is not None:
+            return self._migration_alerts
+        return self._compute_migration_alerts(current_year)
     
     def get_search_statistics(self) -> Dict[str, int]:
         """Get statistics about indexed data."""
         return {
             "indexed": self._indexed,
-            "total_events": sum(len(events) for events in self._year_index.values()),
-            "years_covered": len(self._year_index),
+            "total_events": int(self._event_years.size),
+            "years_covered": int(np.unique(self._sorted_years).size),
             "elephants_indexed": len(self._elephant_by_name),
             "herds_indexed": len(self._herd_by_name),
             "event_types": len(self._event_type_index)